@@ -1,14 +1,36 @@
 #!/usr/bin/env python3
 from PyQt5 import QtWidgets
-import faulthandler, sys
+import faulthandler, sys, argparse
 
 from windows.MainWindow import *
+from misc.Cassette import *
+from misc.PlayerDatabase import *
 
 
 
 if __name__ == '__main__':
     faulthandler.enable()
-    app = QtWidgets.QApplication(sys.argv)
+    # Parsing arguments
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--record", metavar="FILE", nargs="?", const=Cassette.defaultPath, help="record all responses into a cassette file")
+    parser.add_argument("--replay", metavar="FILE", nargs="?", const=Cassette.defaultPath, help="replay responses from a cassette file instead of using network")
+    parser.add_argument("--import-players", metavar="FILE", help="replace players in the player database with players from a JSON file and exit")
+    parser.add_argument("--export-players", metavar="FILE", help="save players from the player database into a JSON file and exit")
+    arguments, remaining = parser.parse_known_args()
+    # Copying players between the player database and a JSON file
+    if arguments.import_players is not None:
+        PlayerDatabase.instance().importFile(arguments.import_players)
+        print("Imported " + str(PlayerDatabase.instance().count()) + " players from " + arguments.import_players)
+        sys.exit(0)
+    if arguments.export_players is not None:
+        PlayerDatabase.instance().exportFile(arguments.export_players)
+        print("Exported " + str(PlayerDatabase.instance().count()) + " players into " + arguments.export_players)
+        sys.exit(0)
+    if arguments.record is not None:
+        Cassette.instance().configure("record", arguments.record)
+    elif arguments.replay is not None:
+        Cassette.instance().configure("replay", arguments.replay)
+    app = QtWidgets.QApplication(sys.argv[:1] + remaining)
     app.setApplicationName('XonStat player tracker v2.3')
     overview = MainWindow()
     sys.exit(app.exec_())
\ No newline at end of file
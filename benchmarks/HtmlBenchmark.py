@@ -0,0 +1,71 @@
+"""Compares parsing text from nicknames in HTML with QTextDocument and with parseTextFromHTML.
+
+Usage: python benchmarks/HtmlBenchmark.py
+"""
+import os, sys, random, timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+from PyQt5 import QtWidgets, QtGui
+
+from misc.Functions import *
+
+
+def generateNicks(count: int) -> list:
+    """Generates nicknames with color codes
+
+    Args:
+        count (int): Number of nicknames
+
+    Returns:
+        list: Raw nicknames
+    """
+    nicks = []
+    for i in range(count):
+        nick = ""
+        for j in range(random.randint(1, 4)):
+            nick += random.choice(["^x%03x" % random.randint(0, 4095), "^" + str(random.randint(0, 9))])
+            nick += random.choice(["Player", "<Clan>", "Tom & Jerry", "  spaced  ", "xX"]) + str(i)
+        nicks.append(nick)
+    return nicks
+
+
+def parseWithDocument(document, text: str) -> str:
+    """Parses text the way it was done before parseTextFromHTML
+
+    Args:
+        document (QtGui.QTextDocument): Shared document
+        text (str): Text with HTML tags
+
+    Returns:
+        str: Lowercase text without HTML tags
+    """
+    document.setHtml(text)
+    return document.toPlainText().lower()
+
+
+def measure(name: str, function, number: int):
+    """Prints average time of a function call
+
+    Args:
+        name (str): Name of the measurement
+        function (callable): Measured function
+        number (int): Number of calls
+    """
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(name.ljust(40) + str(round(seconds * 1000000, 1)).rjust(12) + " us")
+
+
+if __name__ == "__main__":
+    nicks = generateNicks(1000)
+    app = QtWidgets.QApplication(sys.argv[:1])
+    rendered = [processNick(nick) for nick in nicks]
+    # Parsing without cache, like for rows that are shown for the first time
+    measure("parseTextFromHTML: 1k nicks", lambda: [parseTextFromHTML.__wrapped__(text) for text in rendered], 10)
+    measure("parseTextFromHTML: 1k nicks, cached", lambda: [parseTextFromHTML(text) for text in rendered], 10)
+    measure("processNickText: 1k nicks, cached", lambda: [processNickText(nick) for nick in nicks], 10)
+    document = QtGui.QTextDocument()
+    measure("QTextDocument: 1k nicks", lambda: [parseWithDocument(document, text) for text in rendered], 10)
+    # Both ways should give the same text
+    different = [text for text in rendered if parseTextFromHTML(text) != parseWithDocument(document, text)]
+    print(str(len(different)) + " of " + str(len(rendered)) + " nicks were parsed differently")
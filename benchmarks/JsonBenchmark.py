@@ -0,0 +1,111 @@
+"""Compares decoding with json and orjson on recorded /games pages and on a large list of tracked players.
+
+Usage: python benchmarks/JsonBenchmark.py [CASSETTE]
+Pages are taken from a cassette recorded by "Main.py --record", generated pages are used if there are none.
+"""
+import os, sys, json, gzip, base64, random, timeit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loadPages(path: str) -> list:
+    """Loads recorded /games pages
+
+    Args:
+        path (str): Cassette file path
+
+    Returns:
+        list: Page contents
+    """
+    pages = []
+    if os.path.isfile(path):
+        with gzip.open(path, "rt", encoding="utf8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    break
+                if "/games?" in entry["url"] and entry["status"] == 200:
+                    pages.append(base64.b64decode(entry["body"]))
+    return pages
+
+
+def generatePages(count: int) -> list:
+    """Generates pages that look like /games responses
+
+    Args:
+        count (int): Number of pages
+
+    Returns:
+        list: Page contents
+    """
+    pages = []
+    gameID = 10000000
+    for i in range(count):
+        page = []
+        for j in range(20):
+            gameID -= 1
+            page.append({
+                "game_id": gameID,
+                "create_dt": "2022-12-01T12:00:00Z",
+                "game_type_cd": random.choice(["dm", "duel", "ctf", "tdm"]),
+                "map_name": "map" + str(random.randint(1, 200)),
+                "server_name": "Server " + str(random.randint(1, 50)),
+                "map_id": random.randint(1, 200),
+                "server_id": random.randint(1, 50),
+                "winner": random.randint(0, 1),
+                "teams": [],
+                "epoch": 1669896000,
+                "fuzzy_date": "2 days ago"
+            })
+        pages.append(json.dumps(page).encode("utf8"))
+    return pages
+
+
+def generatePlayers(count: int) -> list:
+    """Generates a list of tracked players like in Players.json
+
+    Args:
+        count (int): Number of players
+
+    Returns:
+        list: Players
+    """
+    return [{"id": i, "nick": "^x" + "%03x" % random.randint(0, 4095) + "Player " + str(i), "description": "Description " + str(i)} for i in range(count)]
+
+
+def measure(name: str, function, number: int):
+    """Prints average time of a function call
+
+    Args:
+        name (str): Name of the measurement
+        function (callable): Measured function
+        number (int): Number of calls
+    """
+    seconds = min(timeit.repeat(function, number=number, repeat=5)) / number
+    print(name.ljust(40) + str(round(seconds * 1000000, 1)).rjust(12) + " us")
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(os.path.dirname(__file__), "../config/Cassette.jsonl.gz")
+    pages = loadPages(path)
+    if len(pages) == 0:
+        print("No recorded /games pages were found, using generated pages")
+        pages = generatePages(50)
+    else:
+        print("Using " + str(len(pages)) + " recorded /games pages")
+    players = generatePlayers(10000)
+    playersJSON = json.dumps(players, indent=4).encode("utf8")
+    if orjson is None:
+        print("orjson is not installed, only json is measured")
+    # Decoding game pages
+    measure("json: decode /games pages", lambda: [json.loads(page) for page in pages], 20)
+    if orjson is not None:
+        measure("orjson: decode /games pages", lambda: [orjson.loads(page) for page in pages], 20)
+    # Loading tracked players, saving is not measured because config files are always saved by json
+    measure("json: decode 10k players", lambda: json.loads(playersJSON), 10)
+    if orjson is not None:
+        measure("orjson: decode 10k players", lambda: orjson.loads(playersJSON), 10)
\ No newline at end of file
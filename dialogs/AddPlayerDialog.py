@@ -85,6 +85,5 @@ class AddPlayerDialog(Dialog):
             player["id"] = self.id
             player["nick"] = self.nick.text()
             player["description"] = self.description.text()
-            Config.instance()["Players"].append(player)
-            Config.instance().save("Players")
+            PlayerRegistry.instance().add(player)
             self.reloadAllTabs.emit()
\ No newline at end of file
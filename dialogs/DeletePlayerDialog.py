@@ -40,6 +40,5 @@ class DeletePlayerDialog(Dialog):
         """
         # Deleting player
         if self.player is not None:
-            Config.instance()["Players"].remove(self.player)
-            Config.instance().save("Players")
+            PlayerRegistry.instance().remove(self.id)
             self.reloadAllTabs.emit()
\ No newline at end of file
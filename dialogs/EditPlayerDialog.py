@@ -62,8 +62,5 @@ class EditPlayerDialog(Dialog):
         """
         if self.player is not None:
             # Saving edited information
-            index = Config.instance()["Players"].index(self.player)
-            Config.instance()["Players"][index]["nick"] = self.nick.text()
-            Config.instance()["Players"][index]["description"] = self.description.text()
-            Config.instance().save("Players")
+            PlayerRegistry.instance().update({"id": self.id, "nick": self.nick.text(), "description": self.description.text()})
             self.reloadAllTabs.emit()
\ No newline at end of file
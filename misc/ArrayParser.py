@@ -0,0 +1,77 @@
+import re, json, codecs
+
+
+class ArrayParser():
+    """Incremental parser that decodes elements of a JSON array while the document is still being received
+    """
+
+
+    whitespace = re.compile(r"[\s,]*") # Whitespace and separators between elements
+    trailing = re.compile(r"\s*") # Whitespace after an element
+
+
+    def __init__(self, key: str = None):
+        """Initialising parser
+
+        Args:
+            key (str, optional): Key of the array in the top-level object, None if the document itself is an array. Defaults to None.
+        """
+        self.key = key
+        self.finished = False # Was the end of the array reached?
+        self.__decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__scanner = json.JSONDecoder()
+        self.__buffer = "" # Received text that was not parsed yet
+        self.__started = False # Was the start of the array found?
+        if key is None:
+            self.__start = re.compile(r"\s*\[")
+        else:
+            self.__start = re.compile(r"\"" + re.escape(key) + r"\"\s*:\s*\[")
+
+
+    def feed(self, chunk: bytes, final: bool = False) -> list:
+        """Adds received data and decodes array elements that are complete
+
+        Args:
+            chunk (bytes): Received data
+            final (bool, optional): Is this the last chunk of the document? Defaults to False.
+
+        Raises:
+            ValueError: The document ended before the end of the array
+
+        Returns:
+            list: Decoded elements
+        """
+        self.__buffer += self.__decoder.decode(chunk, final)
+        elements = []
+        position = 0
+        # Finding start of the array
+        if not self.__started and not self.finished:
+            match = self.__start.match(self.__buffer) if self.key is None else self.__start.search(self.__buffer)
+            if match is not None:
+                self.__started = True
+                position = match.end()
+        while self.__started and not self.finished:
+            position = ArrayParser.whitespace.match(self.__buffer, position).end()
+            if position == len(self.__buffer):
+                break
+            if self.__buffer[position] == "]":
+                self.finished = True
+                break
+            try:
+                element, end = self.__scanner.raw_decode(self.__buffer, position)
+            except json.JSONDecodeError:
+                # Element is not complete yet
+                break
+            # Number may continue in the next chunk (e.g. "150" followed by "0.5"), so it is complete only when a separator follows
+            if not final and not isinstance(element, (dict, list, str)):
+                following = ArrayParser.trailing.match(self.__buffer, end).end()
+                if following == len(self.__buffer) or self.__buffer[following] not in ",]":
+                    break
+            elements.append(element)
+            position = end
+        # Keeping only the part that was not parsed yet
+        if self.__started:
+            self.__buffer = self.__buffer[position:]
+        if final and not self.finished:
+            raise ValueError("JSON array is not complete")
+        return elements
\ No newline at end of file
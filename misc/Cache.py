@@ -0,0 +1,255 @@
+import os, re, json, time, sqlite3, threading, requests
+from collections import OrderedDict
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from requests.structures import CaseInsensitiveDict
+
+from misc.Config import *
+from misc.Json import *
+from misc.RateLimiter import *
+
+
+class CachedResponse(requests.Response):
+    """Response stored in cache. Its content is decoded only once for each version.
+    """
+
+
+    def __init__(self):
+        """Initialising response
+        """
+        super().__init__()
+        self.key = None # Normalized address
+        self.version = None # Time when the content was last changed
+        self.expired = False # Does the response need to be revalidated?
+        self.notModified = False # Was the response revalidated by the server?
+
+
+    def json(self, **kwargs):
+        """Decodes response content
+
+        Returns:
+            Decoded JSON content
+        """
+        return Cache.instance().decode(self)
+
+
+
+class Cache():
+    """Singleton for storing responses in a local database
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    schema = 2 # Database schema version
+    # Settings with cache lifetime for each endpoint family
+    lifetimes = [
+        (re.compile(r"^/player/\d+$"), "playerCacheTime"),
+        (re.compile(r"^/games$"), "gameListCacheTime"),
+        (re.compile(r"^/game/\d+$"), "gameCacheTime"),
+        (re.compile(r"^/server/\d+/topscorers$"), "topScorersCacheTime"),
+        (re.compile(r"^/server/\d+$"), "serverCacheTime"),
+        (re.compile(r"^/map/\d+$"), "mapCacheTime"),
+        (re.compile(r"^/players$"), "searchCacheTime")
+    ]
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            Cache: Cache object instance
+        """
+        with Cache.__lock:
+            if Cache.__instance is None:
+                Cache.__instance = Cache()
+        return Cache.__instance
+
+
+    def __init__(self):
+        """Opening the database and removing old responses
+        """
+        self.__databaseLock = threading.Lock()
+        self.__decoded = OrderedDict() # Decoded content and its version, by normalized address
+        self.__decodedLock = threading.Lock()
+        filepath = os.path.join(os.path.dirname(__file__), "../config/Cache.sqlite")
+        self.__database = sqlite3.connect(filepath, check_same_thread=False)
+        with self.__databaseLock:
+            # Recreating the table if it was created by an older version
+            if self.__database.execute("PRAGMA user_version").fetchone()[0] != Cache.schema:
+                self.__database.execute("DROP TABLE IF EXISTS responses")
+                self.__database.execute("PRAGMA user_version = " + str(Cache.schema))
+            self.__database.execute("CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body BLOB, headers TEXT, fetched REAL, changed REAL)")
+            self.__database.execute("DELETE FROM responses WHERE fetched < ?", (time.time() - Config.instance().settings.cacheMaxAge,))
+            self.__database.commit()
+
+
+    def normalize(self, address: str) -> str:
+        """Normalizes an address so that equal requests share a cache entry
+
+        Args:
+            address (str): Web address
+
+        Returns:
+            str: Normalized address
+        """
+        parts = urlsplit(address)
+        path = parts.path.rstrip("/")
+        query = urlencode(sorted(parse_qsl(parts.query)))
+        return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ""))
+
+
+    def getLifetime(self, address: str) -> int:
+        """Gets how long a response from an address stays valid
+
+        Args:
+            address (str): Normalized web address
+
+        Returns:
+            int: Lifetime in seconds, 0 if the address is not cached
+        """
+        path = urlsplit(address).path
+        for pattern, setting in Cache.lifetimes:
+            if pattern.match(path):
+                return getattr(Config.instance().settings, setting)
+        return 0
+
+
+    def __createResponse(self, address: str, url: str, body: bytes, headers: dict, fetched: float, changed: float) -> CachedResponse:
+        """Creates a response object from cached data
+
+        Args:
+            address (str): Web address
+            url (str): Normalized web address
+            body (bytes): Response content
+            headers (dict): Response headers
+            fetched (float): Time when the response was last fetched or revalidated
+            changed (float): Time when the content was last changed
+
+        Returns:
+            CachedResponse: Response object
+        """
+        response = CachedResponse()
+        response.status_code = 200
+        response.url = address
+        response.key = url
+        response.version = changed
+        response.expired = time.time() - fetched > self.getLifetime(url)
+        response._content = body
+        response.headers = CaseInsensitiveDict(headers)
+        # Showing current rate limit instead of the one from the time of caching
+        if RateLimiter.instance().limit is not None:
+            response.headers["X-Ratelimit-Remaining"] = str(RateLimiter.instance().remaining)
+            response.headers["X-Ratelimit-Limit"] = str(RateLimiter.instance().limit)
+        return response
+
+
+    def load(self, address: str) -> CachedResponse:
+        """Loads a response from cache, including an expired one
+
+        Args:
+            address (str): Web address
+
+        Returns:
+            CachedResponse: Cached response, None if the address is not cached
+        """
+        url = self.normalize(address)
+        if self.getLifetime(url) <= 0:
+            return None
+        with self.__databaseLock:
+            row = self.__database.execute("SELECT body, headers, fetched, changed FROM responses WHERE url = ?", (url,)).fetchone()
+        if row is None:
+            return None
+        return self.__createResponse(address, url, row[0], decodeJSON(row[1]), row[2], row[3])
+
+
+    def getValidators(self, response: CachedResponse) -> dict:
+        """Creates headers for revalidating a cached response
+
+        Args:
+            response (CachedResponse): Cached response, can be None
+
+        Returns:
+            dict: Conditional request headers
+        """
+        headers = {}
+        if response is not None:
+            if "ETag" in response.headers:
+                headers["If-None-Match"] = response.headers["ETag"]
+            if "Last-Modified" in response.headers:
+                headers["If-Modified-Since"] = response.headers["Last-Modified"]
+        return headers
+
+
+    def store(self, address: str, response: requests.Response) -> requests.Response:
+        """Saves a successful response into cache
+
+        Args:
+            address (str): Web address
+            response (requests.Response): Server response
+
+        Returns:
+            requests.Response: Cached response, or the original one if it cannot be cached
+        """
+        url = self.normalize(address)
+        if response.status_code != 200 or self.getLifetime(url) <= 0:
+            return response
+        now = time.time()
+        headers = dict(response.headers)
+        with self.__databaseLock:
+            # Keeping the version if the content did not change
+            row = self.__database.execute("SELECT body, changed FROM responses WHERE url = ?", (url,)).fetchone()
+            changed = row[1] if row is not None and row[0] == response.content else now
+            self.__database.execute(
+                "INSERT OR REPLACE INTO responses (url, body, headers, fetched, changed) VALUES (?, ?, ?, ?, ?)",
+                (url, response.content, json.dumps(headers), now, changed)
+            )
+            self.__database.commit()
+        return self.__createResponse(address, url, response.content, headers, now, changed)
+
+
+    def refresh(self, address: str, cached: CachedResponse, response: requests.Response) -> CachedResponse:
+        """Marks a cached response as valid again after the server responded with 304 Not Modified
+
+        Args:
+            address (str): Web address
+            cached (CachedResponse): Cached response
+            response (requests.Response): Server response
+
+        Returns:
+            CachedResponse: Revalidated response
+        """
+        now = time.time()
+        headers = dict(cached.headers)
+        for name in ("ETag", "Last-Modified", "Cache-Control", "Date"):
+            if name in response.headers:
+                headers[name] = response.headers[name]
+        with self.__databaseLock:
+            self.__database.execute("UPDATE responses SET headers = ?, fetched = ? WHERE url = ?", (json.dumps(headers), now, cached.key))
+            self.__database.commit()
+        refreshed = self.__createResponse(address, cached.key, cached.content, headers, now, cached.version)
+        refreshed.notModified = True
+        return refreshed
+
+
+    def decode(self, response: CachedResponse):
+        """Decodes content of a cached response, reusing already decoded content of the same version
+
+        Args:
+            response (CachedResponse): Cached response
+
+        Returns:
+            Decoded JSON content
+        """
+        with self.__decodedLock:
+            decoded = self.__decoded.get(response.key)
+            if decoded is not None and decoded[0] == response.version:
+                self.__decoded.move_to_end(response.key)
+                return decoded[1]
+        data = decodeJSON(response.content)
+        size = max(0, Config.instance().settings.decodedCacheSize)
+        with self.__decodedLock:
+            self.__decoded[response.key] = (response.version, data)
+            self.__decoded.move_to_end(response.key)
+            while len(self.__decoded) > size:
+                self.__decoded.popitem(last=False)
+        return data
\ No newline at end of file
@@ -0,0 +1,129 @@
+import os, gzip, json, time, base64, threading, atexit, requests
+from requests.structures import CaseInsensitiveDict
+
+from misc.Cache import *
+
+
+class Cassette():
+    """Singleton for recording responses into a compressed file and replaying them later without network access.
+    Mode and file are selected by XONSTAT_CASSETTE_MODE ("record" or "replay") and XONSTAT_CASSETTE environment variables.
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    defaultPath = os.path.join(os.path.dirname(__file__), "../config/Cassette.jsonl.gz")
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            Cassette: Cassette object instance
+        """
+        with Cassette.__lock:
+            if Cassette.__instance is None:
+                Cassette.__instance = Cassette()
+                Cassette.__instance.configure(os.environ.get("XONSTAT_CASSETTE_MODE"), os.environ.get("XONSTAT_CASSETTE"))
+        return Cassette.__instance
+
+
+    def __init__(self):
+        """Initialising cassette
+        """
+        self.mode = None # "record", "replay" or None
+        self.path = None
+        self.__file = None # Opened file when recording
+        self.__entries = {} # Recorded responses by normalized address when replaying
+        self.__fileLock = threading.Lock()
+        atexit.register(self.close)
+
+
+    def configure(self, mode: str = None, path: str = None):
+        """Selects cassette mode
+
+        Args:
+            mode (str, optional): "record", "replay" or None for normal operation. Defaults to None.
+            path (str, optional): Cassette file path. Defaults to config/Cassette.jsonl.gz.
+        """
+        self.close()
+        self.mode = mode if mode in ("record", "replay") else None
+        self.path = path if path else Cassette.defaultPath
+        if self.mode == "record":
+            self.__file = gzip.open(self.path, "wt", encoding="utf8")
+            print("Recording responses into " + self.path)
+        elif self.mode == "replay":
+            self.__load()
+            print("Replaying " + str(sum(len(entries) for entries in self.__entries.values())) + " responses from " + self.path)
+
+
+    def close(self):
+        """Closes the recorded file
+        """
+        with self.__fileLock:
+            if self.__file is not None:
+                self.__file.close()
+                self.__file = None
+
+
+    def __load(self):
+        """Loads recorded responses
+        """
+        self.__entries = {}
+        with gzip.open(self.path, "rt", encoding="utf8") as f:
+            try:
+                for line in f:
+                    entry = decodeJSON(line)
+                    self.__entries.setdefault(entry["url"], []).append(entry)
+            except (EOFError, json.JSONDecodeError):
+                # The last entry may be incomplete if recording was interrupted
+                pass
+
+
+    def record(self, address: str, response: requests.Response, latency: float):
+        """Writes a response into the cassette
+
+        Args:
+            address (str): Web address
+            response (requests.Response): Response
+            latency (float): Time it took to get the response, in seconds
+        """
+        entry = {
+            "url": Cache.instance().normalize(address),
+            "status": response.status_code,
+            "headers": dict(response.headers),
+            "body": base64.b64encode(response.content).decode("ascii"),
+            "latency": latency
+        }
+        with self.__fileLock:
+            if self.__file is not None:
+                self.__file.write(json.dumps(entry) + "\n")
+                self.__file.flush()
+
+
+    def replay(self, address: str) -> requests.Response:
+        """Gets a recorded response, waiting as long as it took to load it originally.
+        Repeated requests get recorded responses in the same order, the last one is then reused.
+
+        Args:
+            address (str): Web address
+
+        Raises:
+            requests.ConnectionError: The address was not recorded
+
+        Returns:
+            requests.Response: Recorded response
+        """
+        url = Cache.instance().normalize(address)
+        with self.__fileLock:
+            entries = self.__entries.get(url)
+            if not entries:
+                raise requests.ConnectionError("Response from " + address + " was not recorded")
+            entry = entries.pop(0) if len(entries) > 1 else entries[0]
+        time.sleep(entry["latency"])
+        response = requests.Response()
+        response.status_code = entry["status"]
+        response.url = address
+        response.headers = CaseInsensitiveDict(entry["headers"])
+        response._content = base64.b64decode(entry["body"])
+        return response
\ No newline at end of file
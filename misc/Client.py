@@ -0,0 +1,361 @@
+import threading, requests, random, time
+from concurrent.futures import Future, TimeoutError
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+
+from misc.Config import *
+from misc.RateLimiter import *
+from misc.Cache import *
+from misc.Cassette import *
+from misc.ArrayParser import *
+
+
+class CircuitOpenError(requests.ConnectionError):
+    """Raised when requests to a host are not sent because it failed too many times in a row
+    """
+    pass
+
+
+
+class RequestCanceledError(requests.RequestException):
+    """Raised when a request is abandoned because every tab that needed it stopped loading
+    """
+    pass
+
+
+
+class Client():
+    """Singleton for sending HTTP requests through pooled keep-alive connections
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    streamChunkSize = 256 # Number of bytes that are read from a streamed response at once
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            Client: Client object instance
+        """
+        with Client.__lock:
+            if Client.__instance is None:
+                Client.__instance = Client()
+        return Client.__instance
+
+
+    def __init__(self):
+        """Initialising session storage
+        """
+        self.__sessions = {} # Sessions by host name
+        self.__options = {} # Pool options that were used for creating each session
+        self.__sessionLock = threading.Lock()
+        self.__pending = {} # Futures and owners of requests that are currently being sent, by address
+        self.__pendingLock = threading.Lock()
+        self.__failures = {} # Number of consecutive failed requests, by host name
+        self.__openUntil = {} # Time until which requests to a host are not sent, by host name
+        self.__circuitLock = threading.Lock()
+
+
+    def __getOptions(self) -> tuple:
+        """Gets connection pool options from settings
+
+        Returns:
+            tuple: Pool size and keep-alive flag
+        """
+        settings = Config.instance().settings
+        return (max(1, settings.connectionPoolSize), settings.keepAlive)
+
+
+    def session(self, address: str) -> requests.Session:
+        """Returns a session for the host of an address, creating it when needed
+
+        Args:
+            address (str): Web address
+
+        Returns:
+            requests.Session: Session with a connection pool for this host
+        """
+        host = urlsplit(address).netloc
+        options = self.__getOptions()
+        with self.__sessionLock:
+            session = self.__sessions.get(host)
+            # Recreating the session if pool settings were changed
+            if session is None or self.__options[host] != options:
+                if session is not None:
+                    session.close()
+                poolSize, keepAlive = options
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=poolSize)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                session.headers["Accept"] = "application/json"
+                session.headers["Accept-Encoding"] = "gzip, deflate"
+                if not keepAlive:
+                    session.headers["Connection"] = "close"
+                self.__sessions[host] = session
+                self.__options[host] = options
+        return session
+
+
+    def get(self, address: str, owner = None, canceled: threading.Event = None) -> requests.Response:
+        """Gets a response from a specified address. When a cassette is used, the response
+        is recorded into it or replayed from it.
+
+        Args:
+            address (str): Web address
+            owner (Tab, optional): Tab that needs the response, used for request priority. Defaults to None.
+            canceled (threading.Event, optional): Event that is set when the response is no longer needed. Defaults to None.
+
+        Raises:
+            RequestCanceledError: The request was canceled before the response was received
+
+        Returns:
+            requests.Response: Server response
+        """
+        if Cassette.instance().mode == "replay":
+            response = Cassette.instance().replay(address)
+            RateLimiter.instance().update(response.headers)
+            return response
+        start = time.monotonic()
+        response = self.__get(address, owner, canceled)
+        if Cassette.instance().mode == "record":
+            Cassette.instance().record(address, response, time.monotonic() - start)
+        return response
+
+
+    def __get(self, address: str, owner = None, canceled: threading.Event = None) -> requests.Response:
+        """Gets a response from a specified address, using cached response if there is a valid one.
+        If the same address is already being requested, waits for that response instead.
+
+        Args:
+            address (str): Web address
+            owner (Tab, optional): Tab that needs the response. Defaults to None.
+            canceled (threading.Event, optional): Event that is set when the response is no longer needed. Defaults to None.
+
+        Returns:
+            requests.Response: Server response
+        """
+        url = Cache.instance().normalize(address)
+        with self.__pendingLock:
+            pending = self.__pending.get(url)
+            sending = pending is None
+            if sending:
+                pending = (Future(), [owner], [canceled])
+                self.__pending[url] = pending
+            else:
+                # Waiting request gets the priority of the most important tab that needs it
+                pending[1].append(owner)
+                pending[2].append(canceled)
+        future, owners, cancellations = pending
+        if not sending:
+            while True:
+                try:
+                    return future.result(timeout=0.1)
+                except TimeoutError:
+                    if canceled is not None and canceled.is_set():
+                        raise RequestCanceledError("Request to " + address + " was canceled")
+        try:
+            response = Cache.instance().load(address)
+            if response is None or response.expired:
+                # Revalidating expired response, it is sent only while some tab still needs it
+                cached = response
+                isCanceled = lambda: all(event is not None and event.is_set() for event in cancellations)
+                response = self.send(address, Cache.instance().getValidators(cached), owners, isCanceled=isCanceled)
+                if response.status_code == 304 and cached is not None:
+                    response = Cache.instance().refresh(address, cached, response)
+                else:
+                    response = Cache.instance().store(address, response)
+            future.set_result(response)
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self.__pendingLock:
+                del self.__pending[url]
+        return future.result()
+
+
+    def stream(self, address: str, owner = None, key: str = None):
+        """Gets elements of a JSON array from a specified address while the response is still being received.
+        Compressed responses are decompressed on the fly. Complete response is saved into cache and cassette afterwards,
+        same requests that are sent at once are not merged.
+
+        Args:
+            address (str): Web address
+            owner (Tab, optional): Tab that needs the response, used for request priority. Defaults to None.
+            key (str, optional): Key of the array in the top-level object, None if the response itself is an array. Defaults to None.
+
+        Raises:
+            requests.HTTPError: The server did not respond with a success
+            ValueError: The response is not a valid JSON array
+
+        Yields:
+            Decoded array elements
+        """
+        if Cassette.instance().mode == "replay":
+            response = self.get(address, owner)
+            response.raise_for_status()
+            data = decodeJSON(response.content)
+            yield from (data if key is None else data[key])
+            return
+        cached = Cache.instance().load(address)
+        if cached is not None and not cached.expired:
+            data = cached.json()
+            yield from (data if key is None else data[key])
+            return
+        start = time.monotonic()
+        response = self.send(address, Cache.instance().getValidators(cached), [owner], True)
+        complete = None # Completely received response that can be recorded
+        try:
+            if response.status_code == 304 and cached is not None:
+                complete = Cache.instance().refresh(address, cached, response)
+                data = complete.json()
+                yield from (data if key is None else data[key])
+            elif response.status_code != 200:
+                # Error responses are read at once
+                if response.content is not None:
+                    complete = response
+                response.raise_for_status()
+            else:
+                parser = ArrayParser(key)
+                chunks = []
+                for chunk in response.iter_content(chunk_size=Client.streamChunkSize):
+                    chunks.append(chunk)
+                    yield from parser.feed(chunk)
+                yield from parser.feed(b"", True)
+                response._content = b"".join(chunks)
+                complete = response
+                Cache.instance().store(address, response)
+        finally:
+            response.close()
+            if complete is not None and Cassette.instance().mode == "record":
+                Cassette.instance().record(address, complete, time.monotonic() - start)
+
+
+    def send(self, address: str, headers: dict = None, owners: list = None, stream: bool = False, isCanceled = None) -> requests.Response:
+        """Sends a HTTP GET request on a specified address, paced by the rate limiter.
+        Timeouts, server errors and refused requests are retried with a jittered exponential backoff.
+
+        Args:
+            address (str): Web address
+            headers (dict, optional): Additional request headers. Defaults to None.
+            owners (list, optional): Tabs that need the response. Defaults to None.
+            stream (bool, optional): Should the response content be left unread? Defaults to False.
+            isCanceled (callable, optional): Function that returns True when the response is no longer needed,
+                checked while waiting for the rate limiter and between retries. Defaults to None.
+
+        Raises:
+            CircuitOpenError: The host failed too many times in a row recently
+            RequestCanceledError: The request was canceled before it was sent
+            requests.RequestException: The request could not be sent
+
+        Returns:
+            requests.Response: Server response
+        """
+        host = urlsplit(address).netloc
+        self.__checkCircuit(host)
+        settings = Config.instance().settings
+        response = None
+        error = None
+        for attempt in range(max(0, settings.requestRetries) + 1):
+            if attempt > 0:
+                self.__sleep(random.uniform(0, settings.retryBackoff * 2 ** (attempt - 1)), isCanceled)
+            if response is not None:
+                response.close()
+            if not RateLimiter.instance().acquire(owners, isCanceled):
+                raise RequestCanceledError("Request to " + address + " was canceled")
+            try:
+                response = self.session(address).get(address, headers=headers, timeout=2, stream=stream)
+                error = None
+            except (requests.Timeout, requests.ConnectionError) as e:
+                response = None
+                error = e
+                continue
+            finally:
+                RateLimiter.instance().release()
+            RateLimiter.instance().update(response.headers)
+            if response.status_code == 429:
+                # Waiting is handled by the rate limiter
+                RateLimiter.instance().backoff(response.headers.get("Retry-After"))
+            elif response.status_code < 500:
+                break
+        # Updating circuit breaker
+        self.__updateCircuit(host, error is None and response.status_code < 500)
+        if error is not None:
+            raise error
+        return response
+
+
+    def __sleep(self, amount: float, isCanceled = None):
+        """Waits before a retry, returning early when the request is canceled
+
+        Args:
+            amount (float): Time to wait in seconds
+            isCanceled (callable, optional): Function that returns True when the request is no longer needed. Defaults to None.
+        """
+        end = time.monotonic() + amount
+        while not (isCanceled is not None and isCanceled()):
+            remaining = end - time.monotonic()
+            if remaining <= 0:
+                return
+            time.sleep(min(remaining, 0.1))
+
+
+    def __checkCircuit(self, host: str):
+        """Checks if requests can be sent to a host. After the circuit breaker cooldown
+        ends, a single request is let through to check if the host works again.
+
+        Args:
+            host (str): Host name
+
+        Raises:
+            CircuitOpenError: The host failed too many times in a row recently
+        """
+        with self.__circuitLock:
+            if self.__failures.get(host, 0) < Config.instance().settings.circuitBreakerThreshold:
+                return
+            now = time.monotonic()
+            if now < self.__openUntil.get(host, 0):
+                raise CircuitOpenError("Requests to " + host + " are paused after repeated failures")
+            self.__openUntil[host] = now + Config.instance().settings.circuitBreakerCooldown
+
+
+    def __updateCircuit(self, host: str, successful: bool):
+        """Counts consecutive failures of a host and opens the circuit when there are too many of them
+
+        Args:
+            host (str): Host name
+            successful (bool): Was the request successful?
+        """
+        with self.__circuitLock:
+            if successful:
+                self.__failures[host] = 0
+                self.__openUntil[host] = 0
+            else:
+                self.__failures[host] = self.__failures.get(host, 0) + 1
+                if self.__failures[host] >= Config.instance().settings.circuitBreakerThreshold:
+                    self.__openUntil[host] = time.monotonic() + Config.instance().settings.circuitBreakerCooldown
+                    print("Pausing requests to " + host + " after " + str(self.__failures[host]) + " failed requests")
+
+
+    def stats(self) -> dict:
+        """Counts connection pool hits and misses over all sessions
+
+        Returns:
+            dict: Number of requests that reused a pooled connection ("hits") and number of newly opened connections ("misses")
+        """
+        hits = 0
+        misses = 0
+        with self.__sessionLock:
+            sessions = list(self.__sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                pools = adapter.poolmanager.pools
+                for key in pools.keys():
+                    pool = pools.get(key)
+                    if pool is not None:
+                        misses += pool.num_connections
+                        hits += max(0, pool.num_requests - pool.num_connections)
+        return {"hits": hits, "misses": misses}
\ No newline at end of file
@@ -1,5 +1,44 @@
-from PyQt5 import QtGui
-import os, json
+from PyQt5 import QtGui, QtCore
+import os, threading, atexit
+
+from misc.Json import *
+from misc.SettingsSnapshot import *
+
+
+class ConfigWatcher(QtCore.QObject):
+    """Watches config files and loads the ones that were changed by other programs. Only the JSON files are watched,
+    not the whole directory, because databases in the same directory change all the time.
+    """
+
+
+    changed = QtCore.pyqtSignal(str)
+
+
+    def __init__(self):
+        """Initialising file system watcher
+        """
+        super().__init__()
+        self.folder = os.path.normpath(os.path.join(os.path.dirname(__file__), "../config/"))
+        self.watcher = QtCore.QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.check)
+        for string in os.listdir(self.folder):
+            if string.endswith(".json"):
+                self.watcher.addPath(os.path.join(self.folder, string))
+
+
+    def check(self, filepath: str):
+        """Loads changed config files and announces the changes
+
+        Args:
+            filepath (str): Path of the changed file
+        """
+        for filename in Config.instance().reloadChanged():
+            print("Config file " + filename + " was changed")
+            self.changed.emit(filename)
+        # Files replaced by saving stop being watched and have to be added again
+        if filepath not in self.watcher.files() and os.path.exists(filepath):
+            self.watcher.addPath(filepath)
+
 
 
 class Config(dict):
@@ -8,6 +47,7 @@ class Config(dict):
 
 
     __instance = None # Singeton instance
+    saveDelay = 1.0 # Time for collecting changes before they are saved by saveLater, in seconds
 
 
     def instance():
@@ -22,6 +62,20 @@ class Config(dict):
         return Config.__instance
 
 
+    def __init__(self):
+        """Initialising version counters
+        """
+        super().__init__()
+        self.versions = {} # Number of times each config file was loaded or changed
+        self.__dirty = set() # Names of config files with changes that were not saved yet
+        self.__timer = None # Timer for saving changed config files
+        self.__saveLock = threading.RLock()
+        self.__stats = {} # Modification time, size and inode of each config file when it was last loaded or saved
+        self.watcher = None # Watcher of config files
+        self.settings = SettingsSnapshot({}) # Current settings, replaced as a whole when Settings are changed
+        atexit.register(self.flush)
+
+
     def __load(self):
         """Loading all config files
         """
@@ -29,6 +83,8 @@ class Config(dict):
             # Loading json from config files into self
             folder = os.path.join(os.path.dirname(__file__), "../config/")
             for string in os.listdir(folder):
+                if not string.endswith(".json"):
+                    continue
                 filename = string.split(".")[0]
                 Config.instance().load(filename)
             # Loading fonts
@@ -41,33 +97,175 @@ class Config(dict):
             return False
     
 
+    def __setitem__(self, filename: str, content):
+        """Stores content of a config file and publishes a new settings snapshot when settings are changed
+
+        Args:
+            filename (str): Name of a config file
+            content: Decoded content
+        """
+        super().__setitem__(filename, content)
+        if filename == "Settings":
+            self.settings = SettingsSnapshot(content)
+    
+
+    def watch(self) -> ConfigWatcher:
+        """Starts watching config files, has to be called from the main thread
+
+        Returns:
+            ConfigWatcher: Watcher with a signal for changed config files
+        """
+        if self.watcher is None:
+            self.watcher = ConfigWatcher()
+        return self.watcher
+    
+
+    def isWatching(self) -> bool:
+        """Checks if config files are watched for changes
+
+        Returns:
+            bool: True if config files are loaded again after they change
+        """
+        return self.watcher is not None
+    
+
+    def getStat(self, filename: str) -> tuple:
+        """Gets information used for detecting changes of a config file
+
+        Args:
+            filename (str): Name of a config file
+
+        Returns:
+            tuple: Modification time, size and inode, None if the file does not exist
+        """
+        try:
+            stat = os.stat(self.getPath(filename))
+            return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        except OSError:
+            return None
+    
+
+    def reloadChanged(self) -> list:
+        """Loads config files that were changed by other programs. Files with unsaved changes are not loaded.
+
+        Returns:
+            list: Names of loaded config files
+        """
+        changed = []
+        folder = os.path.join(os.path.dirname(__file__), "../config/")
+        for string in os.listdir(folder):
+            if not string.endswith(".json"):
+                continue
+            filename = string.split(".")[0]
+            if self.isDirty(filename) or self.getStat(filename) == self.__stats.get(filename):
+                continue
+            if self.load(filename):
+                changed.append(filename)
+        return changed
+    
+
+    def getPath(self, filename: str) -> str:
+        """Gets path of a config file
+
+        Args:
+            filename (str): Name of a config file
+
+        Returns:
+            str: File path
+        """
+        return os.path.join(os.path.dirname(__file__), "../config/" + filename + ".json")
+    
+
     def load(self, filename: str):
         """Loads a selected config file
 
         Args:
             filename (str): Name of a config file
         """
+        # Unsaved changes would be lost
+        if self.isDirty(filename):
+            self.save(filename)
         try:
-            filepath = os.path.join(os.path.dirname(__file__), "../config/" + filename + ".json")
-            f = open(filepath, "r", encoding="utf8")
-            Config.instance()[filename] = json.loads(f.read())
+            filepath = self.getPath(filename)
+            stat = self.getStat(filename)
+            f = open(filepath, "rb")
+            Config.instance()[filename] = decodeJSON(f.read())
             f.close()
+            self.__stats[filename] = stat
+            self.versions[filename] = self.versions.get(filename, 0) + 1
             return True
         except:
             return False
     
 
     def save(self, filename: str):
-        """Saves a selected config file
+        """Saves a selected config file. The content is written into a temporary file first,
+        which then replaces the config file, so that the file is never left partially written.
 
         Args:
             filename (str): Name of config file
         """
-        try:
-            filepath = os.path.join(os.path.dirname(__file__), "../config/" + filename + ".json")
-            f = open(filepath, "w")
-            f.write(json.dumps(Config.instance()[filename], sort_keys=False, indent=4))
-            f.close()
-            return True
-        except:
-            return False
\ No newline at end of file
+        with self.__saveLock:
+            filepath = self.getPath(filename)
+            temporary = filepath + ".tmp"
+            try:
+                f = open(temporary, "wb")
+                f.write(encodeJSON(Config.instance()[filename], indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+                f.close()
+                os.replace(temporary, filepath)
+                self.__stats[filename] = self.getStat(filename)
+                self.__dirty.discard(filename)
+                self.versions[filename] = self.versions.get(filename, 0) + 1
+                return True
+            except:
+                try:
+                    os.remove(temporary)
+                except:
+                    pass
+                return False
+    
+
+    def saveLater(self, filename: str):
+        """Marks a config file as changed and saves it shortly afterwards, together with other changes made in the meantime
+
+        Args:
+            filename (str): Name of config file
+        """
+        with self.__saveLock:
+            self.__dirty.add(filename)
+            self.versions[filename] = self.versions.get(filename, 0) + 1
+            if self.__timer is None:
+                self.__timer = threading.Timer(Config.saveDelay, self.flush)
+                self.__timer.daemon = True
+                self.__timer.start()
+    
+
+    def isDirty(self, filename: str) -> bool:
+        """Checks if a config file has changes that were not saved yet
+
+        Args:
+            filename (str): Name of config file
+
+        Returns:
+            bool: True if the file has unsaved changes
+        """
+        with self.__saveLock:
+            return filename in self.__dirty
+    
+
+    def flush(self) -> bool:
+        """Saves all changed config files immediately
+
+        Returns:
+            bool: True if all files were saved
+        """
+        with self.__saveLock:
+            if self.__timer is not None:
+                self.__timer.cancel()
+                self.__timer = None
+            success = True
+            for filename in list(self.__dirty):
+                success = self.save(filename) and success
+            return success
\ No newline at end of file
@@ -1,19 +1,36 @@
-from PyQt5 import QtGui
-import re, colorsys, webbrowser, requests
+import re, html, colorsys, functools, webbrowser
 from xml.sax.saxutils import escape
 
 from misc.Config import *
+from misc.Client import *
+from misc.PlayerRegistry import *
     
 
-def processColor(color: str):
-    """Processes color from player nickname and returns it
+# Colors of "^0" to "^9" codes
+digitColors = {
+    "0": "rgb(128,128,128)",
+    "1": "rgb(255,0,0)",
+    "2": "rgb(51,255,0)",
+    "3": "rgb(255,255,0)",
+    "4": "rgb(51,102,255)",
+    "5": "rgb(51,255,255)",
+    "6": "rgb(255,51,102)",
+    "7": "rgb(255,255,255)",
+    "8": "rgb(153,153,153)",
+    "9": "rgb(128,128,128)"
+}
+colorTable = None # CSS colors by color code without "^" or "^x", lowercase
+
+
+def computeColor(color: str) -> str:
+    """Computes color from player nickname
     Making darker colors less dark (like on XonStat webpage)
 
     Args:
         color (str): Hexadecimal 3-digit RGB color
-    
+
     Returns:
-        [str]: Processed decimal RGB color
+        str: Processed decimal RGB color
     """
     h, l, s = colorsys.rgb_to_hls(int(color[0]*2, 16) / 255, int(color[1]*2, 16) / 255, int(color[2]*2, 16) / 255)
     if l < 0.5:
@@ -21,27 +38,120 @@ def processColor(color: str):
     if l > 1:
         l = 1
     r, g, b = colorsys.hls_to_rgb(h, l, s)
-    return "rgb(" + str(r * 255) + "," + str(g * 255) + "," + str(b * 255) + ")"
+    return "rgb(" + str(round(r * 255)) + "," + str(round(g * 255)) + "," + str(round(b * 255)) + ")"
+
+
+def getColorTable() -> dict:
+    """Gets CSS colors of all color codes, computed when they are first needed
+
+    Returns:
+        dict: CSS colors by color code without "^" or "^x", lowercase
+    """
+    global colorTable
+    if colorTable is None:
+        table = dict(digitColors)
+        for value in range(16 ** 3):
+            color = format(value, "03x")
+            table[color] = computeColor(color)
+        colorTable = table
+    return colorTable
+
+
+def processColor(color: str) -> str:
+    """Processes color from player nickname and returns it
+
+    Args:
+        color (str): Hexadecimal 3-digit RGB color from "^x" code, or a single digit from "^0" to "^9" code
+
+    Returns:
+        [str]: Processed decimal RGB color
+    """
+    return getColorTable()[color.lower()]
+
+
+nickPattern = re.compile(r"\^x([0-9a-fA-F]{3})|\^([0-9])|\^x") # Color codes and other sequences starting with "^"
+nickTable = (None, None, None) # Characters version, translate map for single characters, replacements for other sequences
+
+
+def getNickTable() -> tuple:
+    """Gets replacements from Characters.json, prepared again only after the file changes
+
+    Returns:
+        tuple: Translate map for single characters, replacements for sequences like "^1"
+    """
+    global nickTable
+    version = Config.instance().versions.get("Characters")
+    if nickTable[0] != version or nickTable[1] is None:
+        characters = Config.instance().get("Characters", {})
+        translation = str.maketrans({character: replacement for character, replacement in characters.items() if len(character) == 1})
+        sequences = {character: replacement for character, replacement in characters.items() if len(character) > 1}
+        nickTable = (version, translation, sequences)
+    return nickTable[1], nickTable[2]
 
 
-def processNick(name: str):
+@functools.lru_cache(maxsize=4096)
+def renderNick(name: str, version: int = None) -> tuple:
+    """Processes nickname from xonotic syntax in a single pass
+
+    Args:
+        name (str): Raw nickname loaded from XonStat
+        version (int, optional): Version of Characters.json, results for other versions are not reused. Defaults to None.
+
+    Returns:
+        tuple: Nickname in HTML, nickname as plain text
+    """
+    translation, sequences = getNickTable()
+    htmlParts = []
+    textParts = []
+    position = 0
+    for match in nickPattern.finditer(name):
+        # Text before the sequence
+        part = name[position:match.start()].translate(translation)
+        htmlParts.append(escape(part))
+        textParts.append(part)
+        position = match.end()
+        color = match.group(1) or match.group(2)
+        if color is not None:
+            htmlParts.append('<span style="color:' + processColor(color) + '">')
+        else:
+            htmlParts.append(sequences.get(match.group(), ""))
+    part = name[position:].translate(translation)
+    htmlParts.append(escape(part))
+    textParts.append(part)
+    return "".join(htmlParts), "".join(textParts)
+
+
+def processNick(name: str) -> str:
     """Processes nickname from xonotic syntax to HTML
 
     Args:
         name (str): Raw nickname loaded from XonStat
+
+    Returns:
+        str: Nickname in HTML
     """
-    name = escape(name)
-    for colorCode in re.finditer(r"(\^x*[0-9a-fA-F]{3})", name):
-        name = name.replace(colorCode.group(), '<span style="color:' + processColor( colorCode.group()[2:] ) + '">')
-    # Replacing special characters
-    for character, replacement in Config.instance()["Characters"].items():
-        name = name.replace(character, replacement)
-    return name
+    return renderNick(name, Config.instance().versions.get("Characters"))[0]
 
 
-htmlParser = QtGui.QTextDocument() # TextDocument class for parsing text from HTML
+def processNickText(name: str) -> str:
+    """Processes nickname from xonotic syntax to plain text without colors
+
+    Args:
+        name (str): Raw nickname loaded from XonStat
+
+    Returns:
+        str: Nickname as plain text
+    """
+    return renderNick(name, Config.instance().versions.get("Characters"))[1]
+
+
+htmlTagPattern = re.compile(r"<[^>]*>") # HTML tags
+whitespacePattern = re.compile(r"\s+") # Sequences of whitespace characters
+
+
+@functools.lru_cache(maxsize=4096)
 def parseTextFromHTML(text: str) -> str:
-    """Returns lowercase text without HTML tags
+    """Returns lowercase text without HTML tags. Only simple HTML, like nicknames from processNick, is supported.
 
     Args:
         text (str): Text with HTML tags
@@ -49,8 +159,8 @@ def parseTextFromHTML(text: str) -> str:
     Returns:
         str: Lowercase text without HTML tags
     """
-    htmlParser.setHtml(text)
-    return htmlParser.toPlainText().lower()
+    text = html.unescape(htmlTagPattern.sub("", text))
+    return whitespacePattern.sub(" ", text).strip().lower()
 
 
 def getActiveColor(text: str) -> str:
@@ -148,17 +258,26 @@ def openInBrowser(address: str):
     webbrowser.open(address, new=2)
 
 
-def createRequest(address: str):
-    """Creates a HTTP GET request on a specified address
+def createRequest(address: str, owner = None, canceled: threading.Event = None):
+    """Creates a HTTP GET request on a specified address, using cached response if there is a valid one
+
+    Args:
+        address (str): Web address
+        owner (Tab, optional): Tab that needs the response, its requests go first while it is focused. Defaults to None.
+        canceled (threading.Event, optional): Event that is set when the response is no longer needed. Defaults to None.
+    """
+    return Client.instance().get(address, owner, canceled)
+    
+
+def createStream(address: str, owner = None, key: str = None):
+    """Creates a HTTP GET request on a specified address and decodes elements of a JSON array while they are being received
 
     Args:
         address (str): Web address
+        owner (Tab, optional): Tab that needs the response, its requests go first while it is focused. Defaults to None.
+        key (str, optional): Key of the array in the top-level object, None if the response itself is an array. Defaults to None.
     """
-    return requests.get(
-        address,
-        headers={'Accept': 'application/json'},
-        timeout=2
-    )
+    return Client.instance().stream(address, owner, key)
     
 
 def checkPlayerExistence(identifier: int) -> dict:
@@ -170,8 +289,4 @@ def checkPlayerExistence(identifier: int) -> dict:
     Returns:
         dict: JSON of player
     """
-    if Config.instance().load("Players"):
-        for player in Config.instance()["Players"]:
-            if identifier == player["id"]:
-                return player
-    return None
\ No newline at end of file
+    return PlayerRegistry.instance().get(identifier)
\ No newline at end of file
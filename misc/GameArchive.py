@@ -0,0 +1,108 @@
+import os, sqlite3, threading
+
+from misc.XonStatClient import *
+
+
+class GameArchive():
+    """Singleton for storing games from game lists in a local database. For each list, the archive remembers a range of games
+    that is stored without gaps, so that only games newer than this range have to be loaded again.
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    defaultPath = os.path.join(os.path.dirname(__file__), "../config/GameArchive.sqlite")
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            GameArchive: GameArchive object instance
+        """
+        with GameArchive.__lock:
+            if GameArchive.__instance is None:
+                GameArchive.__instance = GameArchive(GameArchive.defaultPath)
+        return GameArchive.__instance
+
+
+    def __init__(self, filepath: str):
+        """Opening the database
+
+        Args:
+            filepath (str): Database file path
+        """
+        self.__databaseLock = threading.Lock()
+        self.__database = sqlite3.connect(filepath, check_same_thread=False)
+        with self.__databaseLock:
+            self.__database.execute("CREATE TABLE IF NOT EXISTS games (game_id INTEGER PRIMARY KEY, create_dt TEXT NOT NULL, server_name TEXT, map_name TEXT, game_type TEXT)")
+            # Games that belong to each list, e.g. "player/1"
+            self.__database.execute("CREATE TABLE IF NOT EXISTS list_games (list TEXT NOT NULL, game_id INTEGER NOT NULL, PRIMARY KEY (list, game_id)) WITHOUT ROWID")
+            # All games of a list between newest and oldest are stored, complete means that there are no older games
+            self.__database.execute("CREATE TABLE IF NOT EXISTS ranges (list TEXT PRIMARY KEY, newest INTEGER NOT NULL, oldest INTEGER NOT NULL, complete INTEGER NOT NULL)")
+            self.__database.commit()
+
+
+    def store(self, listName: str, games: list):
+        """Stores games from a list
+
+        Args:
+            listName (str): List name, e.g. "player/1"
+            games (list): GameRecord objects
+        """
+        with self.__databaseLock, self.__database:
+            self.__database.executemany(
+                "INSERT OR IGNORE INTO games VALUES (?, ?, ?, ?, ?)",
+                ((game.id, game.createDt.strftime("%Y-%m-%dT%H:%M:%SZ"), game.serverName, game.mapName, game.gameType) for game in games)
+            )
+            self.__database.executemany("INSERT OR IGNORE INTO list_games VALUES (?, ?)", ((listName, game.id) for game in games))
+
+
+    def getRange(self, listName: str) -> tuple:
+        """Gets the range of games of a list that is stored without gaps
+
+        Args:
+            listName (str): List name, e.g. "player/1"
+
+        Returns:
+            tuple: Newest game ID, oldest game ID and True if there are no older games, None if no range is stored
+        """
+        with self.__databaseLock:
+            row = self.__database.execute("SELECT newest, oldest, complete FROM ranges WHERE list = ?", (listName,)).fetchone()
+        if row is None:
+            return None
+        return (row[0], row[1], bool(row[2]))
+
+
+    def setRange(self, listName: str, newest: int, oldest: int, complete: bool):
+        """Changes the range of games of a list that is stored without gaps
+
+        Args:
+            listName (str): List name, e.g. "player/1"
+            newest (int): Newest game ID
+            oldest (int): Oldest game ID
+            complete (bool): Are there no games older than the oldest game?
+        """
+        with self.__databaseLock, self.__database:
+            self.__database.execute("INSERT OR REPLACE INTO ranges VALUES (?, ?, ?, ?)", (listName, newest, oldest, int(complete)))
+
+
+    def getGames(self, listName: str, startGameID: int, oldest: int, limit: int) -> list:
+        """Loads a page of stored games
+
+        Args:
+            listName (str): List name, e.g. "player/1"
+            startGameID (int): ID of the first game on the page
+            oldest (int): ID of the oldest game that can be returned
+            limit (int): Maximum number of games
+
+        Returns:
+            list: GameRecord objects from the newest one
+        """
+        with self.__databaseLock:
+            rows = self.__database.execute(
+                "SELECT g.game_id, g.create_dt, g.server_name, g.map_name, g.game_type FROM list_games l JOIN games g ON g.game_id = l.game_id "
+                "WHERE l.list = ? AND l.game_id <= ? AND l.game_id >= ? ORDER BY l.game_id DESC LIMIT ?",
+                (listName, startGameID, oldest, limit)
+            ).fetchall()
+        return [GameRecord({"game_id": row[0], "create_dt": row[1], "server_name": row[2], "map_name": row[3], "game_type_cd": row[4]}) for row in rows]
@@ -0,0 +1,36 @@
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def decodeJSON(data):
+    """Decodes JSON content, using orjson if it is installed
+
+    Args:
+        data (bytes or str): JSON content
+
+    Returns:
+        Decoded content
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encodeJSON(content, indent: bool = False) -> bytes:
+    """Encodes content into UTF-8 JSON, using orjson if it is installed and the output is not indented.
+    Indented output is always written by json, because orjson cannot indent by 4 spaces like the config files.
+
+    Args:
+        content: Content to encode
+        indent (bool, optional): Should the output be indented by 4 spaces? Defaults to False.
+
+    Returns:
+        bytes: JSON content
+    """
+    if orjson is not None and not indent:
+        return orjson.dumps(content)
+    return json.dumps(content, indent=4 if indent else None, ensure_ascii=False).encode("utf8")
\ No newline at end of file
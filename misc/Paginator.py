@@ -0,0 +1,206 @@
+import time, queue, sqlite3, threading
+from concurrent.futures import ThreadPoolExecutor
+
+from misc.GameArchive import *
+
+
+class Paginator():
+    """Iterates over pages of a game list, loading the next page while the current one is being processed.
+    Games are returned as soon as they are received, before the whole page is loaded.
+    When an archive is used, received games are stored and games that are already archived are not loaded again.
+    """
+
+
+    pageSize = 20 # Number of games on a page of XonStat game list
+
+
+    def __init__(self, load, pages: int, until = None, archive: str = None):
+        """Initialising paginator
+
+        Args:
+            load (callable): Function that receives ID of the first game on a page (None for the first page) and returns an iterable of GameRecord objects,
+                e.g. lambda startGameID: XonStatClient().streamGames(playerID=1, startGameID=startGameID)
+            pages (int): Maximum number of pages
+            until (callable, optional): Function that receives a list of newly received games and returns True when no more games are needed. Defaults to None.
+            archive (str, optional): Name of the list in GameArchive, e.g. "player/1". Defaults to None.
+        """
+        self.load = load
+        self.pages = pages
+        self.until = until
+        self.archive = archive
+        self.finished = False # Were all needed games loaded before reaching the page limit?
+        self.loaded = 0 # Number of successfully loaded pages
+        self.failed = 0 # Number of pages that could not be loaded
+        self.archived = 0 # Number of loaded pages that were read from the archive
+        self.latencies = [] # Time it took to load each page
+        self.__gameIDs = set() # IDs of already received games
+
+
+    def fetch(self, load, startGameID: int, received: queue.Queue, stop: threading.Event = None):
+        """Loads a single page, putting games into a queue as soon as they are received. This method is run in background.
+
+        Args:
+            load (callable): Function that loads the page
+            startGameID (int): ID of the first game on the page, None for the first page
+            received (queue.Queue): Queue for (game, None) tuples, followed by (None, (list of games or None if the request failed, time it took to load the page))
+            stop (threading.Event, optional): Event that is set when the rest of the page is not needed. Defaults to None.
+        """
+        start = time.monotonic()
+        page = []
+        games = None
+        try:
+            games = iter(load(startGameID))
+            for game in games:
+                if stop is not None and stop.is_set():
+                    break
+                page.append(game)
+                received.put((game, None))
+        except:
+            page = None
+        finally:
+            # Closing the response of a page that was not read to the end
+            if hasattr(games, "close"):
+                games.close()
+        received.put((None, (page, time.monotonic() - start)))
+
+
+    def __isArchived(self, startGameID: int, stored: tuple) -> bool:
+        """Checks if a page can be read from the archive
+
+        Args:
+            startGameID (int): ID of the first game on the page, None for the first page
+            stored (tuple): Range of archived games from GameArchive.getRange
+
+        Returns:
+            bool: True if all games on the page are archived
+        """
+        # The newest games are always loaded, the rest of the list is known to be without gaps only after reaching the archived range
+        return stored is not None and startGameID is not None and stored[1] <= startGameID <= stored[0]
+
+
+    def __store(self, games: list):
+        """Stores received games in the archive
+
+        Args:
+            games (list): GameRecord objects
+        """
+        try:
+            GameArchive.instance().store(self.archive, games)
+        except sqlite3.Error as e:
+            print("Unable to archive games: " + str(e))
+
+
+    def __updateRange(self, stored: tuple, newest: int, oldest: int, complete: bool):
+        """Remembers which games of the list are archived without gaps
+
+        Args:
+            stored (tuple): Previously archived range from GameArchive.getRange
+            newest (int): ID of the newest received game
+            oldest (int): ID of the oldest game received without gaps from the newest one
+            complete (bool): Was the end of the list reached?
+        """
+        if stored is not None and oldest - 1 <= stored[0]:
+            # Received games continue with the archived ones
+            complete = complete or (stored[2] and oldest >= stored[1])
+            oldest = min(oldest, stored[1])
+        try:
+            GameArchive.instance().setRange(self.archive, newest, oldest, complete)
+        except sqlite3.Error as e:
+            print("Unable to archive games: " + str(e))
+
+
+    def __iter__(self):
+        """Loads pages one by one
+
+        Yields:
+            list: Received games that were not on previous pages, at least one list is returned for each page
+        """
+        executor = ThreadPoolExecutor(max_workers=1)
+        startGameID = None
+        received = queue.Queue()
+        stored = None
+        newest = None # ID of the newest game in the list
+        oldest = None # ID of the oldest game received without gaps from the newest one
+        complete = False # Was the end of the list reached?
+        if self.archive is not None:
+            try:
+                stored = GameArchive.instance().getRange(self.archive)
+            except sqlite3.Error as e:
+                print("Unable to read archived games: " + str(e))
+        fromArchive = False
+        stop = threading.Event()
+        executor.submit(self.fetch, self.load, startGameID, received, stop)
+        try:
+            for i in range(self.pages):
+                ended = False
+                pageGames = [] # Games received on this page, including ones that were on previous pages
+                while not ended and not self.finished:
+                    # Waiting for a received game, then taking all games that are already there
+                    items = [received.get()]
+                    while not received.empty():
+                        items.append(received.get())
+                    games = []
+                    for game, result in items:
+                        if game is None:
+                            ended = True
+                            page, latency = result
+                        else:
+                            pageGames.append(game)
+                            if game.id not in self.__gameIDs:
+                                self.__gameIDs.add(game.id)
+                                games.append(game)
+                    if len(games) > 0 and self.until is not None and self.until(games):
+                        self.finished = True
+                        if not ended:
+                            # Rest of the page is not needed, the part that was read counts as a loaded page
+                            stop.set()
+                            self.loaded += 1
+                            if fromArchive:
+                                self.archived += 1
+                            elif self.archive is not None:
+                                self.__store(pageGames)
+                            if startGameID is None:
+                                newest = pageGames[0].id
+                            oldest = pageGames[-1].id
+                    if ended:
+                        self.latencies.append(latency)
+                        print("Loaded page " + ("starting at game #" + str(startGameID) if startGameID is not None else "1") + (" from archive" if fromArchive else "") + " in " + str(round(latency * 1000)) + " ms")
+                        if page is None:
+                            self.failed += 1
+                        else:
+                            self.loaded += 1
+                            if fromArchive:
+                                self.archived += 1
+                            elif self.archive is not None and len(page) > 0:
+                                self.__store(page)
+                            if startGameID is None and len(page) > 0:
+                                newest = page[0].id
+                            if len(page) == 0:
+                                self.finished = True
+                                complete = not fromArchive
+                            else:
+                                oldest = page[-1].id
+                                startGameID = page[-1].id - 1
+                                # Archived range ends with the last game of the list
+                                if fromArchive and oldest == stored[1] and stored[2]:
+                                    self.finished = True
+                                    complete = True
+                        # Loading the next page in background, failed pages are loaded again
+                        if not self.finished and i + 1 < self.pages:
+                            received = queue.Queue()
+                            stop = threading.Event()
+                            fromArchive = self.__isArchived(startGameID, stored)
+                            if fromArchive:
+                                listName, limit, last = self.archive, Paginator.pageSize, stored[1]
+                                executor.submit(self.fetch, lambda startGameID: GameArchive.instance().getGames(listName, startGameID, last, limit), startGameID, received, stop)
+                            else:
+                                executor.submit(self.fetch, self.load, startGameID, received, stop)
+                    if len(games) > 0 or ended:
+                        yield games
+                if self.finished:
+                    break
+        finally:
+            stop.set()
+            executor.shutdown(wait=False, cancel_futures=True)
+            if self.archive is not None and newest is not None:
+                self.__updateRange(stored, newest, oldest, complete)
@@ -0,0 +1,239 @@
+import os, sqlite3, threading
+
+from misc.Json import *
+
+
+class PlayerDatabase():
+    """Singleton for storing tracked players in a local database, used instead of Players.json when playerDatabase setting is enabled
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    defaultPath = os.path.join(os.path.dirname(__file__), "../config/Players.sqlite")
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            PlayerDatabase: PlayerDatabase object instance
+        """
+        with PlayerDatabase.__lock:
+            if PlayerDatabase.__instance is None:
+                PlayerDatabase.__instance = PlayerDatabase(PlayerDatabase.defaultPath)
+        return PlayerDatabase.__instance
+
+
+    def __init__(self, filepath: str):
+        """Opening the database
+
+        Args:
+            filepath (str): Database file path
+        """
+        self.__databaseLock = threading.Lock()
+        self.__database = sqlite3.connect(filepath, check_same_thread=False)
+        with self.__databaseLock:
+            # Position keeps the order in which players were added
+            self.__database.execute("CREATE TABLE IF NOT EXISTS players (id INTEGER PRIMARY KEY, nick TEXT NOT NULL, description TEXT NOT NULL, position INTEGER NOT NULL)")
+            self.__database.execute("CREATE INDEX IF NOT EXISTS players_nick ON players (nick COLLATE NOCASE)")
+            self.__database.execute("CREATE INDEX IF NOT EXISTS players_description ON players (description COLLATE NOCASE)")
+            self.__database.execute("CREATE INDEX IF NOT EXISTS players_position ON players (position)")
+            # Databases filled before the import was recorded already contain the imported players
+            if self.__database.execute("PRAGMA user_version").fetchone()[0] == 0 and self.__database.execute("SELECT COUNT(*) FROM players").fetchone()[0] > 0:
+                self.__database.execute("PRAGMA user_version = 1")
+            self.__database.commit()
+
+
+    def isImported(self) -> bool:
+        """Checks if players from Players.json were already copied into the database
+
+        Returns:
+            bool: True if the import happened, even if all players were removed since then
+        """
+        with self.__databaseLock:
+            return self.__database.execute("PRAGMA user_version").fetchone()[0] >= 1
+
+
+    def setImported(self):
+        """Records that players from Players.json were copied into the database, so that they are not copied again
+        """
+        with self.__databaseLock, self.__database:
+            self.__database.execute("PRAGMA user_version = 1")
+
+
+    def __select(self, condition: str, parameters: tuple) -> list:
+        """Selects players
+
+        Args:
+            condition (str): SQL query part after the table name
+            parameters (tuple): Query parameters
+
+        Returns:
+            list: Players as dicts like in Players.json
+        """
+        with self.__databaseLock:
+            rows = self.__database.execute("SELECT id, nick, description FROM players " + condition, parameters).fetchall()
+        return [{"id": row[0], "nick": row[1], "description": row[2]} for row in rows]
+
+
+    def count(self) -> int:
+        """Gets number of tracked players
+
+        Returns:
+            int: Number of players
+        """
+        with self.__databaseLock:
+            return self.__database.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+
+
+    def getIDs(self) -> list:
+        """Gets IDs of all tracked players
+
+        Returns:
+            list: Player IDs in the order in which they were added
+        """
+        with self.__databaseLock:
+            return [row[0] for row in self.__database.execute("SELECT id FROM players ORDER BY position")]
+
+
+    def get(self, identifier: int) -> dict:
+        """Finds a tracked player by ID
+
+        Args:
+            identifier (int): Player ID
+
+        Returns:
+            dict: Player, None if the player is not tracked
+        """
+        players = self.__select("WHERE id = ?", (identifier,))
+        return players[0] if len(players) > 0 else None
+
+
+    def getPage(self, offset: int, limit: int) -> list:
+        """Loads a part of the list of players
+
+        Args:
+            offset (int): Index of the first player
+            limit (int): Maximum number of players
+
+        Returns:
+            list: Players in the order in which they were added
+        """
+        return self.__select("ORDER BY position LIMIT ? OFFSET ?", (limit, offset))
+
+
+    def findByNick(self, nick: str) -> list:
+        """Finds tracked players by their nickname
+
+        Args:
+            nick (str): Nickname, case insensitive
+
+        Returns:
+            list: Players
+        """
+        return self.__select("WHERE nick = ? COLLATE NOCASE ORDER BY position", (nick,))
+
+
+    def findByDescription(self, description: str) -> list:
+        """Finds tracked players by their description
+
+        Args:
+            description (str): Description, case insensitive
+
+        Returns:
+            list: Players
+        """
+        return self.__select("WHERE description = ? COLLATE NOCASE ORDER BY position", (description,))
+
+
+    def add(self, player: dict) -> bool:
+        """Adds a player at the end of the list
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+
+        Returns:
+            bool: True if the player was added, False if it is already tracked
+        """
+        with self.__databaseLock, self.__database:
+            cursor = self.__database.execute(
+                "INSERT OR IGNORE INTO players (id, nick, description, position) SELECT ?, ?, ?, COALESCE(MAX(position), 0) + 1 FROM players",
+                (player["id"], player["nick"], player["description"])
+            )
+            return cursor.rowcount > 0
+
+
+    def update(self, player: dict) -> bool:
+        """Changes nickname and description of a player
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+
+        Returns:
+            bool: True if the player was changed
+        """
+        with self.__databaseLock, self.__database:
+            cursor = self.__database.execute("UPDATE players SET nick = ?, description = ? WHERE id = ?", (player["nick"], player["description"], player["id"]))
+            return cursor.rowcount > 0
+
+
+    def remove(self, identifier: int) -> bool:
+        """Stops tracking a player
+
+        Args:
+            identifier (int): Player ID
+
+        Returns:
+            bool: True if the player was removed
+        """
+        with self.__databaseLock, self.__database:
+            cursor = self.__database.execute("DELETE FROM players WHERE id = ?", (identifier,))
+            return cursor.rowcount > 0
+
+
+    def importPlayers(self, players: list):
+        """Replaces all players with a list in Players.json format
+
+        Args:
+            players (list): Players
+        """
+        with self.__databaseLock, self.__database:
+            self.__database.execute("DELETE FROM players")
+            self.__database.executemany(
+                "INSERT OR REPLACE INTO players (id, nick, description, position) VALUES (?, ?, ?, ?)",
+                ((player["id"], player["nick"], player["description"], position) for position, player in enumerate(players, 1))
+            )
+            self.__database.execute("PRAGMA user_version = 1")
+
+
+    def exportPlayers(self) -> list:
+        """Gets all players in Players.json format
+
+        Returns:
+            list: Players
+        """
+        return self.__select("ORDER BY position", ())
+
+
+    def importFile(self, filepath: str):
+        """Replaces all players with players from a file in Players.json format
+
+        Args:
+            filepath (str): JSON file path
+        """
+        f = open(filepath, "rb")
+        players = decodeJSON(f.read())
+        f.close()
+        self.importPlayers(players)
+
+
+    def exportFile(self, filepath: str):
+        """Saves all players into a file in Players.json format
+
+        Args:
+            filepath (str): JSON file path
+        """
+        f = open(filepath, "wb")
+        f.write(encodeJSON(self.exportPlayers(), indent=True))
+        f.close()
\ No newline at end of file
@@ -0,0 +1,152 @@
+import os, time, sqlite3, threading
+
+
+class PlayerHistory():
+    """Singleton for storing snapshots of tracked player statistics over time. A new snapshot is stored only when
+    the statistics changed, otherwise the time when the latest snapshot was last confirmed is updated.
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    defaultPath = os.path.join(os.path.dirname(__file__), "../config/PlayerHistory.sqlite")
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            PlayerHistory: PlayerHistory object instance
+        """
+        with PlayerHistory.__lock:
+            if PlayerHistory.__instance is None:
+                PlayerHistory.__instance = PlayerHistory(PlayerHistory.defaultPath)
+        return PlayerHistory.__instance
+
+
+    def __init__(self, filepath: str):
+        """Opening the database
+
+        Args:
+            filepath (str): Database file path
+        """
+        self.__databaseLock = threading.Lock()
+        self.__latest = None # Latest snapshot of each player, loaded when it is first needed
+        self.__database = sqlite3.connect(filepath, check_same_thread=False)
+        with self.__databaseLock:
+            # Snapshot is valid from "recorded" until "checked", times are in seconds since epoch
+            self.__database.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots (player_id INTEGER NOT NULL, recorded INTEGER NOT NULL, checked INTEGER NOT NULL, "
+                "games INTEGER NOT NULL, playing_time INTEGER NOT NULL, last_played INTEGER, nick TEXT NOT NULL, PRIMARY KEY (player_id, recorded)) WITHOUT ROWID"
+            )
+            self.__database.commit()
+
+
+    def __loadLatest(self):
+        """Loads the latest snapshot of each player into memory, has to be called with the database lock
+        """
+        if self.__latest is not None:
+            return
+        self.__latest = {}
+        rows = self.__database.execute(
+            "SELECT player_id, recorded, checked, games, playing_time, last_played, nick FROM snapshots s "
+            "WHERE recorded = (SELECT MAX(recorded) FROM snapshots WHERE player_id = s.player_id)"
+        )
+        for row in rows:
+            self.__latest[row[0]] = row[1:]
+
+
+    def record(self, players: list, now: int = None) -> int:
+        """Stores snapshots of players in a single transaction
+
+        Args:
+            players (list): PlayerRecord objects
+            now (int, optional): Time of the snapshots in seconds since epoch. Defaults to current time.
+
+        Returns:
+            int: Number of new snapshots, snapshots of players whose statistics did not change are not counted
+        """
+        if now is None:
+            now = int(time.time())
+        with self.__databaseLock:
+            self.__loadLatest()
+            try:
+                with self.__database:
+                    added = self.__store(players, now)
+            except:
+                # Snapshots in memory could differ from the database after a rollback
+                self.__latest = None
+                raise
+        return added
+
+
+    def __store(self, players: list, now: int) -> int:
+        """Stores snapshots of players, has to be called with the database lock inside a transaction
+
+        Args:
+            players (list): PlayerRecord objects
+            now (int): Time of the snapshots in seconds since epoch
+
+        Returns:
+            int: Number of new snapshots
+        """
+        added = 0
+        for player in players:
+            values = (player.games, int(player.playingTime), player.lastPlayed, player.nick)
+            latest = self.__latest.get(player.id)
+            if latest is not None and latest[2:] == values:
+                # Nothing changed, only extending the validity of the latest snapshot
+                self.__database.execute("UPDATE snapshots SET checked = ? WHERE player_id = ? AND recorded = ?", (now, player.id, latest[0]))
+                self.__latest[player.id] = (latest[0], now) + values
+            else:
+                self.__database.execute("INSERT OR REPLACE INTO snapshots VALUES (?, ?, ?, ?, ?, ?, ?)", (player.id, now, now) + values)
+                self.__latest[player.id] = (now, now) + values
+                added += 1
+        return added
+
+
+    def getLatest(self, playerID: int) -> dict:
+        """Gets the latest snapshot of a player
+
+        Args:
+            playerID (int): Player ID
+
+        Returns:
+            dict: Snapshot, None if the player has no snapshots
+        """
+        with self.__databaseLock:
+            self.__loadLatest()
+            latest = self.__latest.get(playerID)
+        if latest is None:
+            return None
+        return self.__createSnapshot(latest)
+
+
+    def getHistory(self, playerID: int, since: int = 0) -> list:
+        """Gets snapshots of a player
+
+        Args:
+            playerID (int): Player ID
+            since (int, optional): Only snapshots that were valid after this time are returned. Defaults to 0.
+
+        Returns:
+            list: Snapshots from the oldest one
+        """
+        with self.__databaseLock:
+            rows = self.__database.execute(
+                "SELECT recorded, checked, games, playing_time, last_played, nick FROM snapshots WHERE player_id = ? AND checked >= ? ORDER BY recorded",
+                (playerID, since)
+            ).fetchall()
+        return [self.__createSnapshot(row) for row in rows]
+
+
+    def __createSnapshot(self, row: tuple) -> dict:
+        """Converts a database row into a snapshot
+
+        Args:
+            row (tuple): Columns from "recorded" to "nick"
+
+        Returns:
+            dict: Snapshot
+        """
+        return {"recorded": row[0], "checked": row[1], "games": row[2], "playingTime": row[3], "lastPlayed": row[4], "nick": row[5]}
@@ -0,0 +1,300 @@
+import os, time, hashlib, threading
+
+from misc.Config import *
+from misc.Json import *
+from misc.PlayerDatabase import *
+
+
+class PlayerRegistry():
+    """Singleton for accessing tracked players. They are stored either in Players.json, which is indexed in memory and read again only when it changes,
+    or in a database when playerDatabase setting is enabled.
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+    checkInterval = 1.0 # Minimal time between checks of Players.json, in seconds
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            PlayerRegistry: PlayerRegistry object instance
+        """
+        with PlayerRegistry.__lock:
+            if PlayerRegistry.__instance is None:
+                PlayerRegistry.__instance = PlayerRegistry()
+        return PlayerRegistry.__instance
+
+
+    def __init__(self):
+        """Initialising indexes
+        """
+        self.__registryLock = threading.RLock()
+        self.__checked = 0.0 # Time when the file was last checked for changes
+        self.__available = False # Could the file be loaded?
+        self.__stat = None # Modification time and size of the loaded file
+        self.__hash = None # Hash of the loaded file content
+        self.__list = None # Indexed list of players from Config
+        self.__version = None # Config version of the indexed list
+        self.__byID = {} # Players by ID
+        self.__byNick = {} # Players by lowercase nickname
+        self.__byDescription = {} # Players by lowercase description
+        self.__imported = False # Was Players.json imported into an empty database?
+
+
+    def useDatabase(self) -> bool:
+        """Checks if players are stored in a database
+
+        Returns:
+            bool: True if playerDatabase setting is enabled
+        """
+        return Config.instance().settings.playerDatabase
+
+
+    def refresh(self) -> bool:
+        """Rebuilds indexes if the list of players was loaded or saved since the last time.
+        Changes of Players.json made by other programs are checked at most once per checkInterval,
+        unless config files are watched, in which case Config loads the file again by itself.
+
+        Returns:
+            bool: True if the list of players is available
+        """
+        with self.__registryLock:
+            if self.useDatabase():
+                self.__importIntoDatabase()
+                return True
+            now = time.monotonic()
+            if not self.__available or (not Config.instance().isWatching() and now - self.__checked >= PlayerRegistry.checkInterval):
+                self.__checked = now
+                self.__available = self.__checkFile()
+            if not self.__available:
+                return False
+            players = Config.instance()["Players"]
+            version = Config.instance().versions.get("Players")
+            if players is not self.__list or version != self.__version:
+                self.__index(players, version)
+            return True
+
+
+    def __importIntoDatabase(self):
+        """Copies players from Players.json into the database when the database is used for the first time.
+        The import is recorded in the database, so players removed from the database are not imported again.
+        """
+        if self.__imported:
+            return
+        self.__imported = True
+        if PlayerDatabase.instance().isImported() or not self.__checkFile():
+            return
+        if len(Config.instance()["Players"]) > 0:
+            PlayerDatabase.instance().importPlayers(Config.instance()["Players"])
+            print("Imported " + str(len(Config.instance()["Players"])) + " players into database")
+        else:
+            PlayerDatabase.instance().setImported()
+
+
+    def __checkFile(self) -> bool:
+        """Loads Players.json again if its content changed
+
+        Returns:
+            bool: True if the file can be loaded
+        """
+        # Changes that were not saved yet are newer than the file
+        if Config.instance().isDirty("Players") and "Players" in Config.instance():
+            return True
+        try:
+            stat = os.stat(Config.instance().getPath("Players"))
+            stat = (stat.st_mtime_ns, stat.st_size)
+            if stat != self.__stat or "Players" not in Config.instance():
+                f = open(Config.instance().getPath("Players"), "rb")
+                content = f.read()
+                f.close()
+                digest = hashlib.sha1(content).digest()
+                # Modification time can change even if the content did not
+                if digest != self.__hash or "Players" not in Config.instance():
+                    Config.instance()["Players"] = decodeJSON(content)
+                    self.__hash = digest
+                self.__stat = stat
+            return True
+        except:
+            self.__stat = None
+            self.__hash = None
+            return False
+
+
+    def __index(self, players: list, version: int):
+        """Rebuilds indexes
+
+        Args:
+            players (list): List of players
+            version (int): Config version of the list
+        """
+        self.__list = players
+        self.__version = version
+        self.__byID = {}
+        self.__byNick = {}
+        self.__byDescription = {}
+        for player in players:
+            self.__byID[player["id"]] = player
+            self.__byNick.setdefault(player["nick"].lower(), []).append(player)
+            self.__byDescription.setdefault(player["description"].lower(), []).append(player)
+
+
+    def get(self, identifier: int) -> dict:
+        """Finds a tracked player by ID
+
+        Args:
+            identifier (int): Player ID
+
+        Returns:
+            dict: Player, None if the player is not tracked
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return None
+            if self.useDatabase():
+                return PlayerDatabase.instance().get(identifier)
+            return self.__byID.get(identifier)
+
+
+    def findByNick(self, nick: str) -> list:
+        """Finds tracked players by their nickname
+
+        Args:
+            nick (str): Nickname, case insensitive
+
+        Returns:
+            list: Players
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return []
+            if self.useDatabase():
+                return PlayerDatabase.instance().findByNick(nick)
+            return list(self.__byNick.get(nick.lower(), []))
+
+
+    def findByDescription(self, description: str) -> list:
+        """Finds tracked players by their description
+
+        Args:
+            description (str): Description, case insensitive
+
+        Returns:
+            list: Players
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return []
+            if self.useDatabase():
+                return PlayerDatabase.instance().findByDescription(description)
+            return list(self.__byDescription.get(description.lower(), []))
+
+
+    def count(self) -> int:
+        """Gets number of tracked players
+
+        Returns:
+            int: Number of players
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return 0
+            if self.useDatabase():
+                return PlayerDatabase.instance().count()
+            return len(self.__list)
+
+
+    def getIDs(self) -> list:
+        """Gets IDs of all tracked players
+
+        Returns:
+            list: Player IDs in the order in which they were added
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return []
+            if self.useDatabase():
+                return PlayerDatabase.instance().getIDs()
+            return [player["id"] for player in self.__list]
+
+
+    def getPage(self, offset: int, limit: int) -> list:
+        """Loads a part of the list of players
+
+        Args:
+            offset (int): Index of the first player
+            limit (int): Maximum number of players
+
+        Returns:
+            list: Players in the order in which they were added
+        """
+        with self.__registryLock:
+            if not self.refresh():
+                return []
+            if self.useDatabase():
+                return PlayerDatabase.instance().getPage(offset, limit)
+            return self.__list[offset:offset + limit]
+
+
+    def add(self, player: dict) -> bool:
+        """Starts tracking a player
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+
+        Returns:
+            bool: True if the player was changed
+        """
+        with self.__registryLock:
+            if self.useDatabase():
+                return PlayerDatabase.instance().add(player)
+            if not self.refresh():
+                Config.instance()["Players"] = []
+            if self.get(player["id"]) is not None:
+                return False
+            Config.instance()["Players"].append(player)
+            Config.instance().saveLater("Players")
+            return True
+
+
+    def update(self, player: dict) -> bool:
+        """Changes nickname and description of a tracked player
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+
+        Returns:
+            bool: True if the player was changed
+        """
+        with self.__registryLock:
+            if self.useDatabase():
+                return PlayerDatabase.instance().update(player)
+            tracked = self.get(player["id"])
+            if tracked is None:
+                return False
+            tracked["nick"] = player["nick"]
+            tracked["description"] = player["description"]
+            Config.instance().saveLater("Players")
+            return True
+
+
+    def remove(self, identifier: int) -> bool:
+        """Stops tracking a player
+
+        Args:
+            identifier (int): Player ID
+
+        Returns:
+            bool: True if the player was removed
+        """
+        with self.__registryLock:
+            if self.useDatabase():
+                return PlayerDatabase.instance().remove(identifier)
+            tracked = self.get(identifier)
+            if tracked is None:
+                return False
+            Config.instance()["Players"].remove(tracked)
+            Config.instance().saveLater("Players")
+            return True
\ No newline at end of file
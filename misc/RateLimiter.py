@@ -0,0 +1,169 @@
+import threading, time, itertools
+
+from misc.Config import *
+
+
+class RateLimiter():
+    """Singleton for pacing requests based on the rate limit reported by the server.
+    Waiting requests are let through by priority, requests of the focused tab go first.
+    """
+
+
+    __instance = None # Singleton instance
+    __lock = threading.Lock() # Lock for creating the instance
+
+
+    def instance():
+        """Returns instance of this singleton
+
+        Returns:
+            RateLimiter: RateLimiter object instance
+        """
+        with RateLimiter.__lock:
+            if RateLimiter.__instance is None:
+                RateLimiter.__instance = RateLimiter()
+        return RateLimiter.__instance
+
+
+    def __init__(self):
+        """Initialising token bucket
+        """
+        self.__condition = threading.Condition()
+        self.limit = None # Request limit reported by the server
+        self.remaining = None # Remaining number of requests reported by the server
+        self.__tokens = None # Number of requests that can still be sent
+        self.__lastRequest = 0.0 # Time of the last sent request
+        self.__blockedUntil = 0.0 # Time until which no requests can be sent
+        self.__waiting = [] # Tickets of waiting requests
+        self.__sequence = itertools.count() # Counter for ordering requests with the same priority
+        self.__active = 0 # Number of requests that are being sent
+        self.__focused = None # Tab that is currently shown
+
+
+    def __getDelay(self) -> float:
+        """Calculates how long the next request has to wait. Requests are sent immediately
+        while enough of the budget is left and get slower as the budget drains.
+
+        Returns:
+            float: Delay in seconds
+        """
+        now = time.monotonic()
+        if now < self.__blockedUntil:
+            return self.__blockedUntil - now
+        if self.__tokens is None or not self.limit:
+            return 0
+        settings = Config.instance().settings
+        threshold = settings.rateLimitBurstThreshold
+        fraction = max(0, self.__tokens) / self.limit
+        if fraction >= threshold:
+            return 0
+        interval = settings.maxRequestInterval * (1 - fraction / threshold)
+        return self.__lastRequest + interval - now
+
+
+    def getPriority(self, owners: list) -> int:
+        """Gets priority of a request, lower number goes first
+
+        Args:
+            owners (list): Tabs that are waiting for the request. None stands for a request not tied to any tab.
+
+        Returns:
+            int: 0 for requests of the focused tab or not tied to any tab, 1 for requests of background tabs
+        """
+        if owners is None or len(owners) == 0:
+            return 0
+        for owner in owners:
+            if owner is None or owner is self.__focused:
+                return 0
+        return 1
+
+
+    def setFocused(self, tab):
+        """Changes the tab whose requests go first
+
+        Args:
+            tab (Tab): Currently shown tab
+        """
+        with self.__condition:
+            self.__focused = tab
+            self.__condition.notify_all()
+
+
+    def acquire(self, owners: list = None, isCanceled = None) -> bool:
+        """Waits until a request can be sent and takes a token from the bucket.
+        Each acquired request has to be released once it finishes.
+
+        Args:
+            owners (list, optional): Tabs that are waiting for the request. Defaults to None.
+            isCanceled (callable, optional): Function that returns True when the request is no longer needed, checked while waiting. Defaults to None.
+
+        Returns:
+            bool: True if the request can be sent, False if it was canceled while waiting
+        """
+        with self.__condition:
+            ticket = (next(self.__sequence), owners)
+            self.__waiting.append(ticket)
+            try:
+                while True:
+                    if isCanceled is not None and isCanceled():
+                        self.__condition.notify_all()
+                        return False
+                    # Only the waiting request with the highest priority can be sent
+                    first = min(self.__waiting, key=lambda waiting: (self.getPriority(waiting[1]), waiting[0]))
+                    if first is ticket and self.__active < max(1, Config.instance().settings.maxConcurrentRequests):
+                        delay = self.__getDelay()
+                        if delay <= 0:
+                            break
+                        self.__condition.wait(min(delay, 0.5))
+                    else:
+                        self.__condition.wait(0.5)
+            finally:
+                self.__waiting.remove(ticket)
+            self.__active += 1
+            self.__lastRequest = time.monotonic()
+            if self.__tokens is not None:
+                self.__tokens -= 1
+            self.__condition.notify_all()
+        return True
+
+
+    def release(self):
+        """Marks an acquired request as finished
+        """
+        with self.__condition:
+            self.__active -= 1
+            self.__condition.notify_all()
+
+
+    def update(self, headers: dict):
+        """Refills the bucket using X-Ratelimit headers
+
+        Args:
+            headers (dict): Response headers
+        """
+        try:
+            remaining = int(headers["X-Ratelimit-Remaining"])
+            limit = int(headers["X-Ratelimit-Limit"])
+        except:
+            return
+        with self.__condition:
+            self.remaining = remaining
+            self.limit = limit
+            self.__tokens = remaining
+            self.__condition.notify_all()
+
+
+    def backoff(self, retryAfter: str = None):
+        """Stops sending requests for a while after the server refused a request
+
+        Args:
+            retryAfter (str, optional): Value of a Retry-After header. Defaults to None.
+        """
+        try:
+            delay = float(retryAfter)
+        except:
+            delay = Config.instance().settings.rateLimitBackoff
+        with self.__condition:
+            self.__tokens = 0
+            self.__blockedUntil = max(self.__blockedUntil, time.monotonic() + delay)
+            self.__condition.notify_all()
\ No newline at end of file
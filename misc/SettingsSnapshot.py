@@ -0,0 +1,92 @@
+class SettingsSnapshot():
+    """Immutable copy of settings from Settings.json with typed attributes. A new snapshot is created whenever
+    settings are changed, so a worker that keeps a snapshot sees the same values until it finishes.
+    """
+
+
+    # Default value of each setting, values of other types are replaced by defaults
+    defaults = {
+        "heatmapHourSpan": 3,
+        "gameListCount": 5,
+        "recentGamesCount": 10,
+        "reloadTabsAfterChange": True,
+        "connectionPoolSize": 10,
+        "keepAlive": True,
+        "maxRequestInterval": 1.0,
+        "rateLimitBurstThreshold": 0.5,
+        "rateLimitBackoff": 10.0,
+        "playerCacheTime": 60,
+        "gameListCacheTime": 60,
+        "gameCacheTime": 604800,
+        "topScorersCacheTime": 3600,
+        "serverCacheTime": 86400,
+        "mapCacheTime": 86400,
+        "searchCacheTime": 300,
+        "cacheMaxAge": 2592000,
+        "decodedCacheSize": 256,
+        "playerListConcurrency": 4,
+        "requestRetries": 3,
+        "retryBackoff": 0.5,
+        "circuitBreakerThreshold": 5,
+        "circuitBreakerCooldown": 30,
+        "maxConcurrentRequests": 4,
+        "playerDatabase": False,
+        "gameArchive": True
+    }
+    __slots__ = tuple(defaults.keys())
+
+
+    def __init__(self, data: dict):
+        """Copying settings
+
+        Args:
+            data (dict): Settings loaded from Settings.json
+        """
+        for name, default in SettingsSnapshot.defaults.items():
+            value = data.get(name, default)
+            if type(default) == bool:
+                if type(value) != bool:
+                    value = default
+            elif type(default) == float:
+                value = float(value) if type(value) in (int, float) else default
+            elif type(default) == int:
+                value = int(value) if type(value) in (int, float) else default
+            object.__setattr__(self, name, value)
+
+
+    def __setattr__(self, name: str, value):
+        """Prevents changing settings of the snapshot
+
+        Args:
+            name (str): Setting name
+            value: New value
+
+        Raises:
+            AttributeError: Always, snapshots are immutable
+        """
+        raise AttributeError("Settings snapshot cannot be changed")
+
+
+    def __delattr__(self, name: str):
+        """Prevents removing settings of the snapshot
+
+        Args:
+            name (str): Setting name
+
+        Raises:
+            AttributeError: Always, snapshots are immutable
+        """
+        raise AttributeError("Settings snapshot cannot be changed")
+
+
+    def get(self, name: str, default=None):
+        """Gets a setting by its name
+
+        Args:
+            name (str): Setting name
+            default (optional): Value returned for unknown settings. Defaults to None.
+
+        Returns:
+            Setting value
+        """
+        return getattr(self, name, default)
@@ -0,0 +1,416 @@
+import datetime
+from urllib.parse import urlencode
+
+from misc.Functions import *
+from misc.Cache import *
+from misc.Json import *
+
+
+def parseDatetime(text: str) -> datetime.datetime:
+    """Parses a datetime used by XonStat API
+
+    Args:
+        text (str): Datetime in "%Y-%m-%dT%H:%M:%SZ" format
+
+    Returns:
+        datetime.datetime: Parsed datetime (UTC, without timezone information)
+    """
+    return datetime.datetime.strptime(text, "%Y-%m-%dT%H:%M:%SZ")
+
+
+
+class GameModeRecord():
+    """Player statistics for a single game mode
+    """
+
+
+    __slots__ = ("mode", "games", "winRate", "kdRatio", "playingTime", "lastPlayedFuzzy")
+
+
+    def __init__(self, played: dict, stats: dict):
+        """Extracting fields from JSON
+
+        Args:
+            played (dict): Item of "games_played" dict
+            stats (dict): Item of "overall_stats" dict
+        """
+        self.mode = played["game_type_cd"]
+        self.games = played["games"]
+        self.winRate = played["win_pct"]
+        self.kdRatio = stats.get("k_d_ratio", 0)
+        self.playingTime = stats.get("total_playing_time", 0)
+        self.lastPlayedFuzzy = stats.get("last_played_fuzzy", "")
+
+
+
+class PlayerRecord():
+    """Player information from /player/<id>
+    """
+
+
+    __slots__ = ("id", "nick", "joinedFuzzy", "lastPlayed", "lastPlayedFuzzy", "playingTime", "games", "gameModes", "version")
+
+
+    def __init__(self, data: dict, version: float = None):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Decoded response
+            version (float, optional): Version of the cached response. Defaults to None.
+        """
+        overall = data["overall_stats"]["overall"]
+        self.id = data["player"]["player_id"]
+        self.nick = data["player"]["nick"]
+        self.joinedFuzzy = data["player"]["joined_fuzzy"]
+        self.lastPlayed = overall.get("last_played_epoch") # Seconds since epoch
+        self.lastPlayedFuzzy = overall["last_played_fuzzy"]
+        self.playingTime = overall["total_playing_time"]
+        self.games = data["games_played"]["overall"]["games"]
+        # Game modes sorted by the number of games
+        self.gameModes = []
+        for played in sorted(data["games_played"].values(), key=lambda x: x["games"], reverse=True):
+            if played["game_type_cd"] != "overall":
+                self.gameModes.append(GameModeRecord(played, data["overall_stats"].get(played["game_type_cd"], {})))
+        self.version = version
+
+
+
+class GameRecord():
+    """Game from a list of games from /games
+    """
+
+
+    __slots__ = ("id", "createDt", "serverName", "mapName", "gameType")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Item of decoded response
+        """
+        self.id = data["game_id"]
+        self.createDt = parseDatetime(data["create_dt"])
+        self.serverName = data["server_name"]
+        self.mapName = data["map_name"]
+        self.gameType = data["game_type_cd"]
+
+
+
+class GamePlayerRecord():
+    """Player taking part in a game
+    """
+
+
+    __slots__ = ("id", "nick", "score", "color", "ping")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Item of a player list in /game/<id> response
+        """
+        self.id = data["player_id"]
+        self.nick = data["nick"]
+        self.score = data["score"]
+        self.color = data.get("color")
+        self.ping = data.get("avg_latency")
+
+
+
+class GameDetailRecord():
+    """Game information from /game/<id>
+    """
+
+
+    __slots__ = ("id", "createDt", "createDtFuzzy", "serverID", "mapID", "gameType", "gameTypeDescription", "duration", "durationSeconds", "players", "spectators", "forfeits")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Decoded response
+        """
+        self.id = data["game_id"]
+        self.createDt = parseDatetime(data["create_dt"])
+        self.createDtFuzzy = data["create_dt_fuzzy"]
+        self.serverID = data["server_id"]
+        self.mapID = data["map_id"]
+        self.gameType = data["game_type_cd"]
+        self.gameTypeDescription = data["game_type_descr"]
+        self.duration = data["duration"]
+        self.durationSeconds = data["duration_secs"]
+        self.players = [GamePlayerRecord(player) for player in data["player_game_stats"]]
+        self.spectators = [GamePlayerRecord(player) for player in data["spectators"]]
+        self.forfeits = [GamePlayerRecord(player) for player in data["forfeits"]]
+
+
+
+class ServerRecord():
+    """Server information from /server/<id>
+    """
+
+
+    __slots__ = ("id", "name", "ipAddress", "port", "createDt")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Decoded response
+        """
+        self.id = data["server_id"]
+        self.name = data["name"]
+        self.ipAddress = data["ip_addr"]
+        self.port = data["port"]
+        self.createDt = data["create_dt"] # Only shown as text, so it is kept as received
+
+
+
+class MapRecord():
+    """Map information from /map/<id>
+    """
+
+
+    __slots__ = ("id", "name", "createDt")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Decoded response
+        """
+        self.id = data["map_id"]
+        self.name = data["name"]
+        self.createDt = parseDatetime(data["create_dt"])
+
+
+
+class PlayerNameRecord():
+    """Player from a list of top scorers or search results
+    """
+
+
+    __slots__ = ("id", "nick", "score")
+
+
+    def __init__(self, data: dict):
+        """Extracting fields from JSON
+
+        Args:
+            data (dict): Item of decoded response
+        """
+        self.id = data["player_id"]
+        self.nick = data["nick"]
+        self.score = data.get("score")
+
+
+
+class XonStatClient():
+    """Typed client for XonStat API. Methods return None if the server did not respond with a success,
+    request errors are raised.
+    """
+
+
+    address = "https://stats.xonotic.org"
+
+
+    def __init__(self, owner = None, canceled: threading.Event = None):
+        """Initialising client
+
+        Args:
+            owner (Tab, optional): Tab that needs the responses, used for request priority. Defaults to None.
+            canceled (threading.Event, optional): Event that is set when the responses are no longer needed. Defaults to None.
+        """
+        self.owner = owner
+        self.canceled = canceled
+
+
+    def load(self, path: str):
+        """Loads and decodes a response
+
+        Args:
+            path (str): Address path, including query
+
+        Returns:
+            Decoded JSON content and server response, (None, response) if the request was not successful
+        """
+        response = createRequest(XonStatClient.address + path, self.owner, self.canceled)
+        if not response:
+            return None, response
+        # Cached responses reuse already decoded content
+        if isinstance(response, CachedResponse):
+            return response.json(), response
+        return decodeJSON(response.content), response
+
+
+    def player(self, identifier: int) -> PlayerRecord:
+        """Loads player information
+
+        Args:
+            identifier (int): Player ID
+
+        Returns:
+            PlayerRecord: Player information
+        """
+        data, response = self.load("/player/" + str(identifier))
+        if data is None:
+            return None
+        return PlayerRecord(data, getattr(response, "version", None))
+
+
+    def __getGamesPath(self, playerID: int = None, serverID: int = None, mapID: int = None, startGameID: int = None) -> str:
+        """Creates address path of a page of recent games
+
+        Args:
+            playerID (int, optional): Player ID. Defaults to None.
+            serverID (int, optional): Server ID. Defaults to None.
+            mapID (int, optional): Map ID. Defaults to None.
+            startGameID (int, optional): ID of the first game on the page. Defaults to None.
+
+        Returns:
+            str: Address path, including query
+        """
+        query = {}
+        for name, value in (("player_id", playerID), ("server_id", serverID), ("map_id", mapID), ("start_game_id", startGameID)):
+            if value is not None:
+                query[name] = value
+        return "/games?" + urlencode(query)
+
+
+    def games(self, playerID: int = None, serverID: int = None, mapID: int = None, startGameID: int = None) -> list:
+        """Loads a page of recent games
+
+        Args:
+            playerID (int, optional): Player ID. Defaults to None.
+            serverID (int, optional): Server ID. Defaults to None.
+            mapID (int, optional): Map ID. Defaults to None.
+            startGameID (int, optional): ID of the first game on the page. Defaults to None.
+
+        Returns:
+            list: List of GameRecord objects
+        """
+        data, response = self.load(self.__getGamesPath(playerID, serverID, mapID, startGameID))
+        if data is None:
+            return None
+        return [GameRecord(game) for game in data]
+
+
+    def streamGames(self, playerID: int = None, serverID: int = None, mapID: int = None, startGameID: int = None):
+        """Loads a page of recent games, returning games while the response is still being received
+
+        Args:
+            playerID (int, optional): Player ID. Defaults to None.
+            serverID (int, optional): Server ID. Defaults to None.
+            mapID (int, optional): Map ID. Defaults to None.
+            startGameID (int, optional): ID of the first game on the page. Defaults to None.
+
+        Yields:
+            GameRecord: Loaded game
+        """
+        for game in createStream(XonStatClient.address + self.__getGamesPath(playerID, serverID, mapID, startGameID), self.owner):
+            yield GameRecord(game)
+
+
+    def game(self, identifier: int) -> GameDetailRecord:
+        """Loads game information
+
+        Args:
+            identifier (int): Game ID
+
+        Returns:
+            GameDetailRecord: Game information
+        """
+        data, response = self.load("/game/" + str(identifier))
+        if data is None:
+            return None
+        return GameDetailRecord(data)
+
+
+    def server(self, identifier: int) -> ServerRecord:
+        """Loads server information
+
+        Args:
+            identifier (int): Server ID
+
+        Returns:
+            ServerRecord: Server information
+        """
+        data, response = self.load("/server/" + str(identifier))
+        if data is None:
+            return None
+        return ServerRecord(data)
+
+
+    def __getTopScorersPath(self, identifier: int) -> str:
+        """Creates address path of top scoring players of a server
+
+        Args:
+            identifier (int): Server ID
+
+        Returns:
+            str: Address path
+        """
+        return "/server/" + str(identifier) + "/topscorers"
+
+
+    def topScorers(self, identifier: int) -> list:
+        """Loads top scoring players of a server
+
+        Args:
+            identifier (int): Server ID
+
+        Returns:
+            list: List of PlayerNameRecord objects
+        """
+        data, response = self.load(self.__getTopScorersPath(identifier))
+        if data is None:
+            return None
+        return [PlayerNameRecord(player) for player in data["top_scorers"]]
+
+
+    def streamTopScorers(self, identifier: int):
+        """Loads top scoring players of a server, returning players while the response is still being received
+
+        Args:
+            identifier (int): Server ID
+
+        Yields:
+            PlayerNameRecord: Loaded player
+        """
+        for player in createStream(XonStatClient.address + self.__getTopScorersPath(identifier), self.owner, "top_scorers"):
+            yield PlayerNameRecord(player)
+
+
+    def map(self, identifier: int) -> MapRecord:
+        """Loads map information
+
+        Args:
+            identifier (int): Map ID
+
+        Returns:
+            MapRecord: Map information
+        """
+        data, response = self.load("/map/" + str(identifier))
+        if data is None:
+            return None
+        return MapRecord(data)
+
+
+    def search(self, nick: str) -> list:
+        """Searches players by their nickname
+
+        Args:
+            nick (str): Searched nickname
+
+        Returns:
+            list: List of PlayerNameRecord objects
+        """
+        data, response = self.load("/players?" + urlencode({"nick": nick}))
+        if data is None:
+            return None
+        return [PlayerNameRecord(player) for player in data["players"]]
\ No newline at end of file
@@ -78,26 +78,25 @@ class MapInfo(TabInfo):
         self.gameList.setRowCount(0)
     
 
-    def showRecentGame(self, game: dict):
+    def showRecentGame(self, game: GameRecord):
         """Showing recent game by creating a new row in gameList table
 
         Args:
-            game (dict): Game info
+            game (GameRecord): Game info
         """
         row = self.gameList.rowCount()
-        if row >= Config.instance()["Settings"]["recentGamesCount"]:
+        if row >= Config.instance().settings.recentGamesCount:
             return
         self.gameList.insertRow(row)
         # Adding cells
         for i in range(4):
             self.gameList.setCellWidget(row, i, ColoredLabel(self.gameList))
         # Setting cell content
-        date = datetime.datetime.strptime(game["create_dt"], "%Y-%m-%dT%H:%M:%SZ")
-        date_str = date.strftime("%d.%m.%Y %H:%M:%S")
+        date_str = game.createDt.strftime("%d.%m.%Y %H:%M:%S")
         self.gameList.cellWidget(row, 0).setText(date_str)
-        self.gameList.cellWidget(row, 1).setText(game["server_name"])
-        self.gameList.cellWidget(row, 2).setText(game["game_type_cd"].upper())
-        self.gameList.cellWidget(row, 3).setText(game["map_name"])
+        self.gameList.cellWidget(row, 1).setText(game.serverName)
+        self.gameList.cellWidget(row, 2).setText(game.gameType.upper())
+        self.gameList.cellWidget(row, 3).setText(game.mapName)
         # Adding buttons
         actions = ColoredWidget()
         buttonGroup = QtWidgets.QHBoxLayout()
@@ -107,7 +106,7 @@ class MapInfo(TabInfo):
         buttonGroup.addStretch()
         # Button for showing the selected game in browser
         browserButton = BrowserButton(self.gameList)
-        browserButton.clicked.connect(lambda: openInBrowser("https://stats.xonotic.org/game/" + str(game["game_id"])))
+        browserButton.clicked.connect(lambda: openInBrowser("https://stats.xonotic.org/game/" + str(game.id)))
         buttonGroup.addWidget(browserButton)
         # Adding button for showing game in gameInfo window
         gameInfoButton = WindowButton(self.gameList)
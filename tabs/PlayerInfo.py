@@ -74,8 +74,8 @@ class PlayerInfo(TabInfo):
         self.heatmap.setProperty("class", "heatmap")
         # Generating column headers
         columns = []
-        for i in range(0, 24, Config.instance()["Settings"]["heatmapHourSpan"]):
-            columns.append(str(i) + "-" + str(i + Config.instance()["Settings"]["heatmapHourSpan"]))
+        for i in range(0, 24, Config.instance().settings.heatmapHourSpan):
+            columns.append(str(i) + "-" + str(i + Config.instance().settings.heatmapHourSpan))
         # Setting columns
         self.heatmap.setColumnCount(len(columns))
         self.heatmap.setHorizontalHeaderLabels(columns)
@@ -168,26 +168,25 @@ class PlayerInfo(TabInfo):
         self.info.cellWidget(row, 1).layout().itemAt(0).widget().setColor(color)
     
 
-    def showRecentGame(self, game: dict):
+    def showRecentGame(self, game: GameRecord):
         """Showing recent game by creating a new row in gameList table
 
         Args:
-            game (dict): Game info
+            game (GameRecord): Game info
         """
         row = self.gameList.rowCount()
-        if row >= Config.instance()["Settings"]["recentGamesCount"]:
+        if row >= Config.instance().settings.recentGamesCount:
             return
         self.gameList.insertRow(row)
         # Adding cells
         for i in range(4):
             self.gameList.setCellWidget(row, i, ColoredLabel(self.gameList))
         # Setting cell content
-        date = datetime.datetime.strptime(game["create_dt"], "%Y-%m-%dT%H:%M:%SZ")
-        date_str = date.strftime("%d.%m.%Y %H:%M:%S")
+        date_str = game.createDt.strftime("%d.%m.%Y %H:%M:%S")
         self.gameList.cellWidget(row, 0).setText(date_str)
-        self.gameList.cellWidget(row, 1).setText(game["server_name"])
-        self.gameList.cellWidget(row, 2).setText(game["game_type_cd"].upper())
-        self.gameList.cellWidget(row, 3).setText(game["map_name"])
+        self.gameList.cellWidget(row, 1).setText(game.serverName)
+        self.gameList.cellWidget(row, 2).setText(game.gameType.upper())
+        self.gameList.cellWidget(row, 3).setText(game.mapName)
         # Adding buttons
         actions = ColoredWidget()
         buttonGroup = QtWidgets.QHBoxLayout()
@@ -197,7 +196,7 @@ class PlayerInfo(TabInfo):
         buttonGroup.addStretch()
         # Button for showing the selected game in browser
         browserButton = BrowserButton(self.gameList)
-        browserButton.clicked.connect(lambda: openInBrowser("https://stats.xonotic.org/game/" + str(game["game_id"])))
+        browserButton.clicked.connect(lambda: openInBrowser("https://stats.xonotic.org/game/" + str(game.id)))
         buttonGroup.addWidget(browserButton)
         # Adding button for showing game in gameInfo window
         gameInfoButton = WindowButton(self.gameList)
@@ -229,25 +228,21 @@ class PlayerInfo(TabInfo):
             widget.setBackground("heatmap-" + currentText)
     
 
-    def showGameStats(self, dataList: list, dataDict: dict):
+    def showGameStats(self, gameModes: list):
         """Shows information about game modes
 
         Args:
-            dataList (list): List of game mode stats
-            dataDict (dict): Dict with game mode stats
+            gameModes (list): List of GameModeRecord objects
         """
-        for gameMode in dataList:
-            name = gameMode["game_type_cd"]
-            if name == "overall":
-                continue
+        for gameMode in gameModes:
             row = self.gameStats.rowCount()
             self.gameStats.insertRow(row)
             for column in range(self.gameStats.columnCount()):
                 self.gameStats.setCellWidget(row, column, ColoredLabel(self.gameStats))
-            self.gameStats.cellWidget(row, 0).setText(name.upper())
-            self.gameStats.cellWidget(row, 1).setText(str(gameMode["games"]))
-            self.gameStats.cellWidget(row, 2).setText(str(round(gameMode["win_pct"], 2)))
-            self.gameStats.cellWidget(row, 3).setText(str(round(dataDict[name]["k_d_ratio"], 2)))
-            self.gameStats.cellWidget(row, 4).setText(str(round(dataDict[name]["total_playing_time"] / 3600, 1)))
-            self.gameStats.cellWidget(row, 5).setText(dataDict[name]["last_played_fuzzy"])
-            self.gameStats.cellWidget(row, 5).setColor(getActiveColor(dataDict[name]["last_played_fuzzy"]))
\ No newline at end of file
+            self.gameStats.cellWidget(row, 0).setText(gameMode.mode.upper())
+            self.gameStats.cellWidget(row, 1).setText(str(gameMode.games))
+            self.gameStats.cellWidget(row, 2).setText(str(round(gameMode.winRate, 2)))
+            self.gameStats.cellWidget(row, 3).setText(str(round(gameMode.kdRatio, 2)))
+            self.gameStats.cellWidget(row, 4).setText(str(round(gameMode.playingTime / 3600, 1)))
+            self.gameStats.cellWidget(row, 5).setText(gameMode.lastPlayedFuzzy)
+            self.gameStats.cellWidget(row, 5).setColor(getActiveColor(gameMode.lastPlayedFuzzy))
\ No newline at end of file
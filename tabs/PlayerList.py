@@ -1,8 +1,8 @@
-from PyQt5 import QtWidgets, QtGui
+from PyQt5 import QtWidgets, QtCore
 
 from tabs.Tab import *
-from widgets.ColoredWidgets import *
-from widgets.ColoredButtons import *
+from widgets.PlayerListModel import *
+from widgets.PlayerListDelegate import *
 from workers.PlayerListWorker import *
 from misc.Functions import *
 from dialogs.DeletePlayerDialog import *
@@ -14,6 +14,10 @@ class PlayerList(Tab):
     """
 
 
+    searchDelay = 150 # Time after the last change of the searched text before rows are filtered, in milliseconds
+    rowHeight = 30 # Height of each row, in pixels
+
+
     def __init__(self, parent):
         """Init
 
@@ -22,8 +26,6 @@ class PlayerList(Tab):
         """
         super().__init__(parent)
         self.name = "Player List"
-        # TextDocument class for parsing text from HTML
-        self.__doc = QtGui.QTextDocument()
     
 
     def createLayout(self):
@@ -32,21 +34,37 @@ class PlayerList(Tab):
         # Creating search bar
         self.searchBar = QtWidgets.QLineEdit(self)
         self.searchBar.setPlaceholderText("Search by player ID, nickname, description or current player name")
-        self.searchBar.textChanged.connect(self.__search)
+        self.searchBar.textChanged.connect(self.__startSearch)
         self.layout.addWidget(self.searchBar)
-        # Creating table for tracked players
-        self.table = ColoredTable(self)
-        # Setting columns
-        headers = ["ID", "Player nickname", "Player description", "Current player name", "Playing since", "Last played", "Actions"]
-        self.table.setColumnCount( len(headers) )
-        self.table.setHorizontalHeaderLabels(headers)
+        # Filtering rows after typing stops
+        self.searchTimer = QtCore.QTimer(self)
+        self.searchTimer.setSingleShot(True)
+        self.searchTimer.setInterval(PlayerList.searchDelay)
+        self.searchTimer.timeout.connect(lambda: self.__search(self.searchBar.text()))
+        # Creating model with tracked players and a filter for searching
+        self.model = PlayerListModel(self)
+        self.filter = PlayerListFilter(self)
+        self.filter.setSourceModel(self.model)
+        # Creating table for tracked players, only visible rows are painted
+        self.table = QtWidgets.QTableView(self)
+        self.table.setModel(self.filter)
+        self.delegate = PlayerListDelegate(self.table)
+        self.delegate.actionClicked.connect(self.__runAction)
+        self.table.setItemDelegate(self.delegate)
+        self.table.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
+        self.table.setVerticalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
+        self.table.setHorizontalScrollMode(QtWidgets.QAbstractItemView.ScrollPerPixel)
         # Setting column stretching
+        self.table.horizontalHeader().setMinimumSectionSize(140)
         self.table.horizontalHeader().setSectionResizeMode(0, QtWidgets.QHeaderView.ResizeToContents)
         for i in range(1, 4):
             self.table.horizontalHeader().setSectionResizeMode(i, QtWidgets.QHeaderView.Stretch)
-        for i in range(4, len(headers)):
+        for i in range(4, len(PlayerListModel.headers)):
             self.table.horizontalHeader().setSectionResizeMode(i, QtWidgets.QHeaderView.ResizeToContents)
-        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        # Rows have the same height, so it does not have to be computed for each of them
+        self.table.verticalHeader().setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(PlayerList.rowHeight)
         self.layout.addWidget(self.table)
 
     
@@ -54,45 +72,10 @@ class PlayerList(Tab):
         """Adds a single row with player data to table
 
         Args:
-            player (dics): Player info
+            player (dict): Player info
+            row (int, optional): Row index, the row is added at the end if it is negative. Defaults to -1.
         """
-        if row < 0:
-            row = self.table.rowCount()
-        # Creating a new row inside the table
-        self.table.insertRow(row)
-        # Adding labels
-        for i in range(6):
-            self.table.setCellWidget(row, i, ColoredLabel(self.table, "", "dark-grey"))
-        # Adding label text
-        self.table.cellWidget(row, 0).setText(str(player["id"]))
-        self.table.cellWidget(row, 1).setText(player["nick"])
-        self.table.cellWidget(row, 2).setText(player["description"])
-        # Adding buttons
-        actions = ColoredWidget()
-        actions.setBackground("dark-grey")
-        buttonGroup = QtWidgets.QHBoxLayout()
-        actions.setLayout(buttonGroup)
-        buttonGroup.setContentsMargins(0, 0, 0, 0)
-        buttonGroup.setSpacing(0)
-        buttonGroup.addStretch()
-        # Profile button
-        profileButton = BrowserButton(self.table)
-        profileButton.clicked.connect(lambda: openInBrowser("https://stats.xonotic.org/player/" + str(player["id"])))
-        buttonGroup.addWidget(profileButton)
-        # PlayerInfo button
-        infoButton = WindowButton(self.table)
-        infoButton.clicked.connect(lambda: self.parent.openPlayerInfo(player["id"]))
-        buttonGroup.addWidget(infoButton)
-        # Stacked widget with edit and save button
-        editButton = EditButton(self.table)
-        editButton.clicked.connect(lambda: EditPlayerDialog(self.parent, player["id"]))
-        buttonGroup.addWidget(editButton)
-        # Delete button
-        deleteButton = DeleteButton(self.table)
-        deleteButton.clicked.connect(lambda: DeletePlayerDialog(self.parent, player["id"]))
-        buttonGroup.addWidget(deleteButton)
-        buttonGroup.addStretch()
-        self.table.setCellWidget(row, 6, actions)
+        self.model.insertPlayer(player, row)
 
 
     def removePlayer(self, row: int):
@@ -101,54 +84,71 @@ class PlayerList(Tab):
         Args:
             row (int): Row index
         """
-        self.table.removeRow(row)
+        self.model.removePlayer(row)
 
     
-    def updatePlayer(self, row: int, data: dict):
+    def updatePlayer(self, row: int, data: PlayerRecord):
         """Fills in loaded player data
 
         Args:
             row (int): Row index
-            data (dict): Player data in JSON
+            data (PlayerRecord): Player information
+        """
+        self.model.updatePlayer(row, data)
+    
+
+    def setRowColor(self, row: int, background: str = None):
+        """Changes background color of a row
+
+        Args:
+            row (int): Row index
+            background (str, optional): Background color name defined in Colors.json. Defaults to None.
         """
-        # Showing nick
-        nick = processNick( data["player"]["nick"] )
-        self.table.cellWidget(row, 3).setText(nick)
-        # Showing when the player started playing
-        since = data["player"]["joined_fuzzy"]
-        self.table.cellWidget(row, 4).setText(since)
-        self.table.cellWidget(row, 4).setColor(getAgeColor(since))
-        # Showing the last time the player was active
-        active = data["overall_stats"]["overall"]["last_played_fuzzy"]
-        self.table.cellWidget(row, 5).setText(active)
-        self.table.cellWidget(row, 5).setColor(getActiveColor(active))
-        # Setting row color
-        nick = parseTextFromHTML(nick)
-        name = parseTextFromHTML( self.table.cellWidget(row, 1).text() )
-        description = parseTextFromHTML( self.table.cellWidget(row, 2).text() )
-        if nick in name or name in nick or nick in description or (description in nick and len(description) > 0):
-            self.table.setRowColor(row, "dark-blue")
-        else:
-            self.table.setRowColor(row, None)
+        self.model.setRowColor(row, background)
     
 
+    def updateRowColor(self, row: int):
+        """Sets row color based on whether the current player name matches the tracked nickname or description
+
+        Args:
+            row (int): Row index
+        """
+        self.model.updateRowColor(row)
+    
+
+    def __runAction(self, action: str, playerID: int):
+        """Handles clicks on action buttons
+
+        Args:
+            action (str): Action name
+            playerID (int): Player ID
+        """
+        if action == "browser":
+            openInBrowser("https://stats.xonotic.org/player/" + str(playerID))
+        elif action == "info":
+            self.parent.openPlayerInfo(playerID)
+        elif action == "edit":
+            EditPlayerDialog(self.parent, playerID)
+        elif action == "delete":
+            DeletePlayerDialog(self.parent, playerID)
+
+
+    def __startSearch(self, text: str):
+        """Waits for typing to stop before rows are filtered
+
+        Args:
+            text (str): Serched text
+        """
+        self.searchTimer.start()
+
+
     def __search(self, text: str):
-        """Hiding and showing rows in the table based on input
+        """Showing only rows matching the input
 
         Args:
             text (str): Serched text
         """
-        for row in range(self.table.rowCount()):
-            containsText = False
-            for column in range(0, 4):
-                widget = self.table.cellWidget(row, column)
-                if not widget == None and type(widget) == ColoredLabel:
-                    # Checking if this label contins HTML
-                    labelText = parseTextFromHTML(widget.text())
-                    if text.lower() in labelText:
-                        containsText = True
-                        break
-            self.table.setRowHidden(row, not containsText)
+        self.filter.setQuery(text)
     
 
     def startLoading(self):
@@ -160,6 +160,16 @@ class PlayerList(Tab):
             self.worker.start()
     
 
+    def configChanged(self, filename: str):
+        """Reloading the tab after Players.json was changed by another program
+
+        Args:
+            filename (str): Name of the config file
+        """
+        if filename == "Players":
+            self.startLoading()
+    
+
     def localKeyPressEvent(self, event):
         """Handling key press events
 
@@ -130,6 +130,16 @@ class Settings(Tab):
             self.worker.start()
     
 
+    def configChanged(self, filename: str):
+        """Reloading the tab after Settings.json was changed by another program
+
+        Args:
+            filename (str): Name of the config file
+        """
+        if filename == "Settings":
+            self.startLoading()
+    
+
     def localKeyPressEvent(self, event):
         """Handling key press events
 
@@ -1,6 +1,7 @@
 from PyQt5 import QtWidgets
 
 from widgets.Status import *
+from misc.Config import *
 
 
 class Tab(QtWidgets.QWidget):
@@ -23,6 +24,8 @@ class Tab(QtWidgets.QWidget):
         self.createLayout()
         self.status = Status(self)
         self.layout.addWidget(self.status)
+        # Reacting to config files changed by other programs
+        Config.instance().watch().changed.connect(self.configChanged)
         self.startLoading()
     
 
@@ -45,6 +48,15 @@ class Tab(QtWidgets.QWidget):
             self.worker.cancel = True
     
 
+    def configChanged(self, filename: str):
+        """Called after a config file was changed by another program and loaded again
+
+        Args:
+            filename (str): Name of the config file
+        """
+        pass
+    
+
     def localKeyPressEvent(self, event):
         """Handling key press events
 
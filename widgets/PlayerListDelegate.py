@@ -0,0 +1,179 @@
+from PyQt5 import QtWidgets, QtCore, QtGui
+import functools
+import qtawesome as qta
+
+from widgets.PlayerListModel import *
+
+
+@functools.lru_cache(maxsize=4096)
+def createStaticText(html: str) -> QtGui.QStaticText:
+    """Prepares a nickname or description in HTML for repeated painting
+
+    Args:
+        html (str): Nickname or description in HTML
+
+    Returns:
+        QtGui.QStaticText: Text with laid out colors
+    """
+    text = QtGui.QStaticText(html)
+    text.setTextFormat(QtCore.Qt.RichText)
+    return text
+
+
+
+class PlayerListDelegate(QtWidgets.QStyledItemDelegate):
+    """Paints cells of the list of tracked players, including colored nicknames and action buttons, only for visible rows
+    """
+
+
+    actionClicked = QtCore.pyqtSignal(str, int)
+    # Action name, icon name, background color and tooltip of each button
+    actions = [
+        ("browser", "msc.browser", "blue", "Open in browser"),
+        ("info", "msc.graph", "yellow", "More information"),
+        ("edit", "fa5s.pencil-alt", "orange", "Edit information"),
+        ("delete", "fa5s.trash-alt", "red", "Delete player")
+    ]
+    padding = 4 # Space around text and buttons, in pixels
+
+
+    def __init__(self, parent: QtWidgets.QWidget):
+        """Loading icons
+
+        Args:
+            parent (QtWidgets.QWidget): Table view
+        """
+        super().__init__(parent)
+        self.icons = [qta.icon(icon, color="#DDD") for action, icon, background, tooltip in PlayerListDelegate.actions]
+
+
+    def getButtonRects(self, rect: QtCore.QRect) -> list:
+        """Gets positions of action buttons in a cell
+
+        Args:
+            rect (QtCore.QRect): Cell rectangle
+
+        Returns:
+            list: QtCore.QRect for each button
+        """
+        size = rect.height() - 2 * PlayerListDelegate.padding
+        width = size * len(PlayerListDelegate.actions)
+        left = rect.left() + max(0, (rect.width() - width) // 2)
+        top = rect.top() + PlayerListDelegate.padding
+        return [QtCore.QRect(left + i * size, top, size, size) for i in range(len(PlayerListDelegate.actions))]
+
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex):
+        """Paints a single cell
+
+        Args:
+            painter (QtGui.QPainter): Painter
+            option (QtWidgets.QStyleOptionViewItem): Cell style options
+            index (QtCore.QModelIndex): Cell index
+        """
+        painter.save()
+        background = index.data(QtCore.Qt.BackgroundRole)
+        if background is not None:
+            painter.fillRect(option.rect, background)
+        rect = option.rect.adjusted(PlayerListDelegate.padding, 0, -PlayerListDelegate.padding, 0)
+        painter.setClipRect(option.rect)
+        if index.column() == 6:
+            # Action buttons
+            for (action, icon, color, tooltip), buttonRect, buttonIcon in zip(PlayerListDelegate.actions, self.getButtonRects(option.rect), self.icons):
+                fill = getColor(color)
+                if fill is not None:
+                    painter.fillRect(buttonRect, fill)
+                iconSize = buttonRect.height() * 2 // 3
+                iconRect = QtCore.QRect(0, 0, iconSize, iconSize)
+                iconRect.moveCenter(buttonRect.center())
+                buttonIcon.paint(painter, iconRect)
+        elif index.column() in (1, 2, 3):
+            # Nicknames and descriptions with colors
+            html = index.data(HtmlRole)
+            if html:
+                painter.setPen(option.palette.color(QtGui.QPalette.Text))
+                text = createStaticText(html)
+                top = rect.top() + (rect.height() - int(text.size().height())) // 2
+                painter.drawStaticText(rect.left(), top, text)
+        else:
+            foreground = index.data(QtCore.Qt.ForegroundRole)
+            painter.setPen(foreground if foreground is not None else option.palette.color(QtGui.QPalette.Text))
+            text = option.fontMetrics.elidedText(index.data(QtCore.Qt.DisplayRole) or "", QtCore.Qt.ElideRight, rect.width())
+            painter.drawText(rect, QtCore.Qt.AlignVCenter | QtCore.Qt.AlignLeft, text)
+        painter.restore()
+
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        """Gets preferred cell size
+
+        Args:
+            option (QtWidgets.QStyleOptionViewItem): Cell style options
+            index (QtCore.QModelIndex): Cell index
+
+        Returns:
+            QtCore.QSize: Cell size
+        """
+        size = super().sizeHint(option, index)
+        if index.column() == 6:
+            size.setWidth((size.height() + 2 * PlayerListDelegate.padding) * len(PlayerListDelegate.actions))
+        return size
+
+
+    def __getAction(self, position: QtCore.QPoint, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> int:
+        """Finds an action button at a position
+
+        Args:
+            position (QtCore.QPoint): Position in the view
+            option (QtWidgets.QStyleOptionViewItem): Cell style options
+            index (QtCore.QModelIndex): Cell index
+
+        Returns:
+            int: Action index, None if there is no button
+        """
+        if index.column() != 6:
+            return None
+        for i, buttonRect in enumerate(self.getButtonRects(option.rect)):
+            if buttonRect.contains(position):
+                return i
+        return None
+
+
+    def editorEvent(self, event: QtCore.QEvent, model: QtCore.QAbstractItemModel, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> bool:
+        """Handles clicks on action buttons
+
+        Args:
+            event (QtCore.QEvent): Event
+            model (QtCore.QAbstractItemModel): Model of the view
+            option (QtWidgets.QStyleOptionViewItem): Cell style options
+            index (QtCore.QModelIndex): Cell index
+
+        Returns:
+            bool: True if the event was handled
+        """
+        if event.type() == QtCore.QEvent.MouseButtonRelease and event.button() == QtCore.Qt.LeftButton:
+            action = self.__getAction(event.pos(), option, index)
+            if action is not None:
+                playerID = int(index.sibling(index.row(), 0).data(QtCore.Qt.DisplayRole))
+                self.actionClicked.emit(PlayerListDelegate.actions[action][0], playerID)
+                return True
+        return super().editorEvent(event, model, option, index)
+
+
+    def helpEvent(self, event: QtGui.QHelpEvent, view: QtWidgets.QAbstractItemView, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> bool:
+        """Shows tooltips of action buttons
+
+        Args:
+            event (QtGui.QHelpEvent): Event
+            view (QtWidgets.QAbstractItemView): Table view
+            option (QtWidgets.QStyleOptionViewItem): Cell style options
+            index (QtCore.QModelIndex): Cell index
+
+        Returns:
+            bool: True if the event was handled
+        """
+        if event.type() == QtCore.QEvent.ToolTip:
+            action = self.__getAction(event.pos(), option, index)
+            if action is not None:
+                QtWidgets.QToolTip.showText(event.globalPos(), PlayerListDelegate.actions[action][3], view)
+                return True
+        return super().helpEvent(event, view, option, index)
@@ -0,0 +1,345 @@
+from PyQt5 import QtCore, QtGui
+
+from misc.Config import *
+from misc.Functions import *
+from misc.XonStatClient import *
+
+
+HtmlRole = QtCore.Qt.UserRole # Role for nicknames and descriptions in HTML
+colorCache = (None, {}) # Colors.json version, QColor objects by color name
+
+
+def getColor(name: str) -> QtGui.QColor:
+    """Gets a color defined in Colors.json by the name used in stylesheets
+
+    Args:
+        name (str): Color name, e.g. "dark-grey", "blue", "age-1" or "active-1"
+
+    Returns:
+        QtGui.QColor: Color, None if it is not defined
+    """
+    global colorCache
+    version = Config.instance().versions.get("Colors")
+    if colorCache[0] != version:
+        colorCache = (version, {})
+    colors = colorCache[1]
+    if name not in colors:
+        value = None
+        definitions = Config.instance().get("Colors", {})
+        try:
+            if name.startswith("age-"):
+                value = definitions["age"][int(name[4:]) - 1]
+            elif name.startswith("active-"):
+                value = definitions["activity"][int(name[7:]) - 1]
+            elif name.startswith("dark-") or name.startswith("light-"):
+                variant, preset = name.split("-", 1)
+                value = definitions["presets"][preset][variant]
+            else:
+                value = definitions["presets"][name]["normal"]
+        except (KeyError, IndexError, ValueError):
+            pass
+        colors[name] = QtGui.QColor(value) if value is not None else None
+    return colors[name]
+
+
+
+class PlayerRow():
+    """Row of the list of tracked players
+    """
+
+
+    __slots__ = ("id", "nick", "description", "current", "currentHTML", "since", "sinceColor", "active", "activeColor", "background", "haystack")
+
+
+    def __init__(self, player: dict):
+        """Initialising row with a tracked player
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+        """
+        self.id = player["id"]
+        self.nick = player["nick"]
+        self.description = player["description"]
+        self.current = "" # Current player name as plain text
+        self.currentHTML = "" # Current player name in HTML
+        self.since = ""
+        self.sinceColor = None
+        self.active = ""
+        self.activeColor = None
+        self.background = "dark-grey"
+        self.updateHaystack()
+
+
+    def updateHaystack(self):
+        """Prepares lowercase text of searched columns
+        """
+        self.haystack = "\n".join((str(self.id), parseTextFromHTML(self.nick), parseTextFromHTML(self.description), self.current.lower()))
+
+
+
+class PlayerListModel(QtCore.QAbstractTableModel):
+    """Model with tracked players and their current information
+    """
+
+
+    headers = ["ID", "Player nickname", "Player description", "Current player name", "Playing since", "Last played", "Actions"]
+
+
+    def __init__(self, parent = None):
+        """Initialising empty model
+
+        Args:
+            parent (QtCore.QObject, optional): Parent object. Defaults to None.
+        """
+        super().__init__(parent)
+        self.rows = [] # PlayerRow objects
+        self.byID = {} # PlayerRow objects by player ID
+        self.query = "" # Text that rows are currently filtered by
+        self.matches = None # IDs of players matching the query, None if all players match
+
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Gets number of rows
+
+        Returns:
+            int: Number of tracked players
+        """
+        return 0 if parent.isValid() else len(self.rows)
+
+
+    def columnCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        """Gets number of columns
+
+        Returns:
+            int: Number of columns
+        """
+        return 0 if parent.isValid() else len(PlayerListModel.headers)
+
+
+    def headerData(self, section: int, orientation: QtCore.Qt.Orientation, role: int = QtCore.Qt.DisplayRole):
+        """Gets column names and row numbers
+
+        Args:
+            section (int): Column or row index
+            orientation (QtCore.Qt.Orientation): Header orientation
+            role (int, optional): Data role. Defaults to QtCore.Qt.DisplayRole.
+        """
+        if role != QtCore.Qt.DisplayRole:
+            return None
+        if orientation == QtCore.Qt.Horizontal:
+            return PlayerListModel.headers[section]
+        return str(section + 1)
+
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        """Gets content of a cell
+
+        Args:
+            index (QtCore.QModelIndex): Cell index
+            role (int, optional): Data role. Defaults to QtCore.Qt.DisplayRole.
+        """
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        column = index.column()
+        if role == QtCore.Qt.DisplayRole:
+            return (str(row.id), row.nick, row.description, row.current, row.since, row.active, None)[column]
+        elif role == HtmlRole and column in (1, 2, 3):
+            return (row.nick, row.description, row.currentHTML)[column - 1]
+        elif role == QtCore.Qt.ForegroundRole:
+            if column == 4 and row.sinceColor is not None:
+                return getColor(row.sinceColor)
+            if column == 5 and row.activeColor is not None:
+                return getColor(row.activeColor)
+        elif role == QtCore.Qt.BackgroundRole and row.background is not None:
+            return getColor(row.background)
+        return None
+
+
+    def getIDs(self) -> list:
+        """Gets IDs of players in the order of rows
+
+        Returns:
+            list: Player IDs
+        """
+        return [row.id for row in self.rows]
+
+
+    def getPlayerID(self, row: int) -> int:
+        """Gets ID of a player in a row
+
+        Args:
+            row (int): Row index
+
+        Returns:
+            int: Player ID
+        """
+        return self.rows[row].id
+
+
+    def insertPlayer(self, player: dict, row: int = -1):
+        """Adds a row with a tracked player
+
+        Args:
+            player (dict): Player with "id", "nick" and "description" keys
+            row (int, optional): Row index, the row is added at the end if it is negative. Defaults to -1.
+        """
+        if row < 0 or row > len(self.rows):
+            row = len(self.rows)
+        item = PlayerRow(player)
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
+        self.rows.insert(row, item)
+        self.byID[item.id] = item
+        self.__updateMatch(item)
+        self.endInsertRows()
+
+
+    def removePlayer(self, row: int):
+        """Removes a row
+
+        Args:
+            row (int): Row index
+        """
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+        item = self.rows.pop(row)
+        self.byID.pop(item.id, None)
+        if self.matches is not None:
+            self.matches.discard(item.id)
+        self.endRemoveRows()
+
+
+    def updatePlayer(self, row: int, data: PlayerRecord):
+        """Fills in loaded player data
+
+        Args:
+            row (int): Row index
+            data (PlayerRecord): Player information
+        """
+        item = self.rows[row]
+        item.currentHTML, item.current = renderNick(data.nick, Config.instance().versions.get("Characters"))
+        item.since = data.joinedFuzzy
+        item.sinceColor = getAgeColor(item.since)
+        item.active = data.lastPlayedFuzzy
+        item.activeColor = getActiveColor(item.active)
+        item.background = self.__getMatchingColor(item)
+        item.updateHaystack()
+        self.__updateMatch(item)
+        self.__rowChanged(row)
+
+
+    def setRowColor(self, row: int, background: str = None):
+        """Changes background color of a row
+
+        Args:
+            row (int): Row index
+            background (str, optional): Background color name defined in Colors.json. Defaults to None.
+        """
+        self.rows[row].background = background
+        self.__rowChanged(row)
+
+
+    def updateRowColor(self, row: int):
+        """Sets row color based on whether the current player name matches the tracked nickname or description
+
+        Args:
+            row (int): Row index
+        """
+        self.setRowColor(row, self.__getMatchingColor(self.rows[row]))
+
+
+    def __getMatchingColor(self, item: PlayerRow) -> str:
+        """Gets row color based on whether the current player name matches the tracked nickname or description
+
+        Args:
+            item (PlayerRow): Row
+
+        Returns:
+            str: Background color name, None for the default background
+        """
+        nick = item.current.lower()
+        name = parseTextFromHTML(item.nick)
+        description = parseTextFromHTML(item.description)
+        if nick in name or name in nick or nick in description or (description in nick and len(description) > 0):
+            return "dark-blue"
+        return None
+
+
+    def __rowChanged(self, row: int):
+        """Lets views know that a row changed
+
+        Args:
+            row (int): Row index
+        """
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(PlayerListModel.headers) - 1))
+
+
+    def __updateMatch(self, item: PlayerRow):
+        """Checks if a row matches the current query
+
+        Args:
+            item (PlayerRow): Row
+        """
+        if self.matches is not None:
+            if self.query in item.haystack:
+                self.matches.add(item.id)
+            else:
+                self.matches.discard(item.id)
+
+
+    def setQuery(self, text: str):
+        """Finds rows matching a searched text
+
+        Args:
+            text (str): Searched text
+        """
+        query = text.lower()
+        if query == "":
+            matches = None
+        elif self.matches is not None and self.query in query:
+            # Longer query can only match rows that matched the previous one
+            matches = {playerID for playerID in self.matches if query in self.byID[playerID].haystack}
+        else:
+            matches = {item.id for item in self.rows if query in item.haystack}
+        self.query = query
+        self.matches = matches
+
+
+    def isMatching(self, row: int) -> bool:
+        """Checks if a row matches the current query
+
+        Args:
+            row (int): Row index
+
+        Returns:
+            bool: True if the row should be shown
+        """
+        return self.matches is None or self.rows[row].id in self.matches
+
+
+
+class PlayerListFilter(QtCore.QSortFilterProxyModel):
+    """Shows only players matching a searched text
+    """
+
+
+    def setQuery(self, text: str):
+        """Filters rows by a searched text
+
+        Args:
+            text (str): Searched text
+        """
+        self.sourceModel().setQuery(text)
+        self.invalidateFilter()
+
+
+    def filterAcceptsRow(self, sourceRow: int, sourceParent: QtCore.QModelIndex) -> bool:
+        """Checks if a row should be shown
+
+        Args:
+            sourceRow (int): Row index in PlayerListModel
+            sourceParent (QtCore.QModelIndex): Parent index
+
+        Returns:
+            bool: True if the row matches the searched text
+        """
+        return self.sourceModel().isMatching(sourceRow)
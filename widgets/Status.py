@@ -70,6 +70,17 @@ class Status(ColoredWidget):
             self.parent.parent.tabWidget.widget(i).status.rate.setText(remaining + " / " + limit)
     
 
+    def showPoolStats(self, hits: int, misses: int):
+        """Shows connection pool usage in the tooltip of the ratelimit label
+
+        Args:
+            hits (int): Number of requests that reused a pooled connection
+            misses (int): Number of newly opened connections
+        """
+        for i in range(self.parent.parent.tabWidget.count()):
+            self.parent.parent.tabWidget.widget(i).status.rate.setToolTip("Connection pool hits: " + str(hits) + ", misses: " + str(misses))
+    
+
     def message(self, message: str, changeIcon: bool = True):
         """Changing status message and setting background color to yellow. Used for starting a new task
 
@@ -44,6 +44,7 @@ class MainWindow(Window):
         self.tabWidget.setMovable(True)
         self.tabWidget.tabCloseRequested.connect(self.removeTab)
         self.tabWidget.currentChanged.connect(self.updateRefreshButtons)
+        self.tabWidget.currentChanged.connect(self.updateRequestPriority)
         # Adding corner buttons
         actions = ColoredWidget()
         buttonGroup = QtWidgets.QHBoxLayout()
@@ -124,6 +125,12 @@ class MainWindow(Window):
                 self.refreshButtons.setCurrentIndex(0)
     
 
+    def updateRequestPriority(self):
+        """Lets requests of the currently shown tab go first
+        """
+        RateLimiter.instance().setFocused(self.tabWidget.currentWidget())
+    
+
     def __addTab(self, page: Tab):
         """Adds a new tab
 
@@ -328,7 +335,7 @@ class MainWindow(Window):
     def reloadAllTabs(self):
         """Attempts to reload all tabs
         """
-        if Config.instance()["Settings"]["reloadTabsAfterChange"]:
+        if Config.instance().settings.reloadTabsAfterChange:
             for i in range(self.tabWidget.count()):
                 self.tabWidget.widget(i).startLoading()
     
@@ -359,4 +366,9 @@ class MainWindow(Window):
             widget = self.tabWidget.widget(i)
             data = self.getTabData(widget)
             Config.instance()["Tabs"].append(data)
-        Config.instance().save("Tabs")
\ No newline at end of file
+        Config.instance().save("Tabs")
+        # Saving changes that are waiting to be saved
+        Config.instance().flush()
+        # Showing connection pool usage
+        stats = Client.instance().stats()
+        print("Connection pool hits: " + str(stats["hits"]) + ", misses: " + str(stats["misses"]))
\ No newline at end of file
@@ -1,6 +1,7 @@
 from PyQt5 import QtCore
 
 from misc.Functions import *
+from misc.XonStatClient import *
 from dialogs.Dialog import *
 
 
@@ -27,16 +28,14 @@ class AddPlayerDialogWorker(QtCore.QThread):
     def run(self):
         """Running the Worker task
         """
-        response = None
+        player = None
         try:
-            response = createRequest("https://stats.xonotic.org/player/" + str(self.dialog.id))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            player = XonStatClient().player(self.dialog.id)
         except:
             pass
         # Canceling
         if self.cancel:
             return
         # Checking response
-        if response is not None and response:
-            data = response.json()
-            self.setPlayerNickname.emit(processNick( data["player"]["nick"] ))
\ No newline at end of file
+        if player is not None:
+            self.setPlayerNickname.emit(processNick(player.nick))
\ No newline at end of file
@@ -1,11 +1,11 @@
 from PyQt5 import QtCore
-import datetime
 
 from workers.Worker import *
 from misc.Config import *
 from tabs.Tab import *
 from misc.Functions import *
 from workers.TabInfoWorker import *
+from misc.XonStatClient import *
 
 
 class GameInfoWorker(TabInfoWorker):
@@ -41,7 +41,6 @@ class GameInfoWorker(TabInfoWorker):
         data = self.loadGameInformation()
         if data is not None:
             # Canceling
-            self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
             if self.cancel:
                 return
             # Loading additional information
@@ -52,27 +51,25 @@ class GameInfoWorker(TabInfoWorker):
         """Loading game information
 
         Returns:
-            dict: Loaded game data
+            GameDetailRecord: Loaded game data
         """
         self.message.emit("Loading game information")
         for i in range(1, self.tab.info.rowCount()):
             self.setInfoRowColor.emit(i, "dark-yellow")
-        response = None
+        data = None
         try:
-            response = createRequest("https://stats.xonotic.org/game/" + str(self.tab.id))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            data = XonStatClient(self.tab).game(self.tab.id)
         except:
             pass
+        self.emitRate()
         # Checking response
-        if response is not None and response:
-            data = response.json()
+        if data is not None:
             # Showing game information
-            gameDatetime = datetime.datetime.strptime(data["create_dt"], "%Y-%m-%dT%H:%M:%SZ")
-            self.setInfoContent.emit(1, gameDatetime.strftime("%d.%m.%Y %H:%M:%S UTC") + " (" + data["create_dt_fuzzy"] + ")")
-            self.setInfoContent.emit(2, "(#" + str(data["server_id"]) + ")")
-            self.setInfoContent.emit(3, "(#" + str(data["map_id"]) + ")")
-            self.setInfoContent.emit(4, data["game_type_cd"].upper() + " (" + data["game_type_descr"] + ")")
-            self.setInfoContent.emit(5, data["duration"] + " (" + str(data["duration_secs"]) + " seconds)")
+            self.setInfoContent.emit(1, data.createDt.strftime("%d.%m.%Y %H:%M:%S UTC") + " (" + data.createDtFuzzy + ")")
+            self.setInfoContent.emit(2, "(#" + str(data.serverID) + ")")
+            self.setInfoContent.emit(3, "(#" + str(data.mapID) + ")")
+            self.setInfoContent.emit(4, data.gameType.upper() + " (" + data.gameTypeDescription + ")")
+            self.setInfoContent.emit(5, data.duration + " (" + str(data.durationSeconds) + " seconds)")
             # Adding players to table
             self.addPlayers(data)
             self.resultMessage.emit("Successfully loaded game information", True)
@@ -86,15 +83,15 @@ class GameInfoWorker(TabInfoWorker):
             return None
     
 
-    def addPlayers(self, data: dict):
+    def addPlayers(self, data: GameDetailRecord):
         """Adds players to table
 
         Args:
-            data (dict): JSON dict
+            data (GameDetailRecord): Game data
         """
         # Adding players to table
         playerArrays = {
-            "player_game_stats": {
+            "players": {
                 "group": "Players",
                 "color": None
             },
@@ -108,61 +105,62 @@ class GameInfoWorker(TabInfoWorker):
             }
         }
         for array, settings in playerArrays.items():
-            if len(data[array]) > 0:
+            players = getattr(data, array)
+            if len(players) > 0:
                 self.showGroupName.emit(settings["group"].upper())
-            for player in data[array]:
+            for player in players:
                 if settings["color"] == None:
-                    if "color" in player:
-                        if player["color"] == "":
+                    if player.color is not None:
+                        if player.color == "":
                             color = "blue"
                         else:
-                            color = player["color"]
+                            color = player.color
                 else:
                     color = settings["color"]
-                if "avg_latency" in player:
-                    ping = str(player["avg_latency"])
+                if player.ping is not None:
+                    ping = str(player.ping)
                 else:
                     ping = ""
-                self.showPlayer.emit(player["player_id"], player["nick"], player["score"], color, ping)
+                self.showPlayer.emit(player.id, player.nick, player.score, color, ping)
 
 
-    def loadAdditionalInformation(self, data: dict):
+    def loadAdditionalInformation(self, data: GameDetailRecord):
         """Loads additional information for info table
 
         Args:
-            data (dict): Game data
+            data (GameDetailRecord): Game data
         """
         self.message.emit("Loading additional information")
         successful = 0
         current = 0
         # Loading server name
         self.setInfoRowColor.emit(2, "dark-yellow")
-        response = None
+        server = None
         try:
             current += 1
-            response = createRequest("https://stats.xonotic.org/server/" + str(data["server_id"]))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            server = XonStatClient(self.tab).server(data.serverID)
         except:
             pass
-        if response:
+        self.emitRate()
+        if server is not None:
             successful += 1
-            self.addInfoContent.emit(2, response.json()["name"])
+            self.addInfoContent.emit(2, server.name)
             self.setInfoRowColor.emit(2, None)
         else:
             self.setInfoRowColor.emit(1, "dark-red")
         self.progress.emit(current, 2)
         # Loading map name
         self.setInfoRowColor.emit(3, "dark-yellow")
-        response = None
+        mapRecord = None
         try:
             current += 1
-            response = createRequest("https://stats.xonotic.org/map/" + str(data["map_id"]))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            mapRecord = XonStatClient(self.tab).map(data.mapID)
         except:
             pass
-        if response:
+        self.emitRate()
+        if mapRecord is not None:
             successful += 1
-            self.addInfoContent.emit(3, response.json()["name"])
+            self.addInfoContent.emit(3, mapRecord.name)
             self.setInfoRowColor.emit(3, None)
         else:
             self.setInfoRowColor.emit(2, "dark-red")
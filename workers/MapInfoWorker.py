@@ -1,9 +1,10 @@
 from PyQt5 import QtCore
-import datetime
 
 from misc.Config import *
 from misc.Functions import *
 from workers.TabInfoWorker import *
+from misc.Paginator import *
+from misc.XonStatClient import *
 
 
 class MapInfoWorker(TabInfoWorker):
@@ -11,7 +12,7 @@ class MapInfoWorker(TabInfoWorker):
     """
 
 
-    showRecentGame = QtCore.pyqtSignal(dict)
+    showRecentGame = QtCore.pyqtSignal(object)
 
 
     def __init__(self, tab: Tab):
@@ -35,8 +36,7 @@ class MapInfoWorker(TabInfoWorker):
         """
         # Loading player information
         self.loadServerInformation()
-        # Sleeping
-        self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
+        # Canceling
         if self.cancel:
             return
         # Loading recent games
@@ -49,19 +49,17 @@ class MapInfoWorker(TabInfoWorker):
         self.message.emit("Loading map information")
         for i in range(1, 2):
             self.setInfoRowColor.emit(i, "dark-yellow")
-        response = None
+        mapRecord = None
         try:
-            response = createRequest("https://stats.xonotic.org/map/" + str(self.tab.id))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            mapRecord = XonStatClient(self.tab).map(self.tab.id)
         except:
             pass
+        self.emitRate()
         # Checking response
-        if response is not None and response:
-            data = response.json()
+        if mapRecord is not None:
             # Showing player information
-            self.setInfoContent.emit(1, data["name"])
-            gameDatetime = datetime.datetime.strptime(data["create_dt"], "%Y-%m-%dT%H:%M:%SZ")
-            self.setInfoContent.emit(2, gameDatetime.strftime("%d.%m.%Y %H:%M:%S UTC"))
+            self.setInfoContent.emit(1, mapRecord.name)
+            self.setInfoContent.emit(2, mapRecord.createDt.strftime("%d.%m.%Y %H:%M:%S UTC"))
             self.resultMessage.emit("Successfully loaded map information", True)
             for i in range(1, 2):
                 self.setInfoRowColor.emit(i, None)
@@ -72,48 +70,52 @@ class MapInfoWorker(TabInfoWorker):
     
 
     def loadGames(self):
-        current = 0
-        correct = 0
         self.message.emit("Loading recent games")
         self.setInfoRowColor.emit(6, "dark-yellow")
-        # Loading list of games
-        url = "https://stats.xonotic.org/games?map_id=" + str(self.tab.id)
-        for i in range( Config.instance()["Settings"]["gameListCount"] ):
-            # Sleeping
-            time.sleep( Config.instance()["Settings"]["singleRequestInterval"] )
+        # Loading list of games until there are enough of them to fill the table
+        self.gamesLoaded = 0
+        client = XonStatClient(self.tab)
+        # Games older than the newest archived game are read from the archive
+        archive = "map/" + str(self.tab.id) if self.settings.gameArchive else None
+        paginator = Paginator(lambda startGameID: client.streamGames(mapID=self.tab.id, startGameID=startGameID), self.settings.gameListCount, self.isLoadingFinished, archive)
+        for games in paginator:
             # Canceling
             if self.cancel:
                 break
-            # Getting list of games
-            current += 1
-            self.progress.emit(current, Config.instance()["Settings"]["gameListCount"])
-            try:
-                response = createRequest(url)
-                self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
-                if response:
-                    correct += 1
-                    data = response.json()
-                    if data is not None and len(data) > 0:
-                        self.processGames(data)
-                        # Getting new URL
-                        url = "https://stats.xonotic.org/games?map_id=" + str(self.tab.id) + "&start_game_id=" + str(data[-1]["game_id"] -1)
-                    else:
-                        break
-            except:
-                pass
+            # Showing games while the page is being loaded
+            self.progress.emit(paginator.loaded + paginator.failed, self.settings.gameListCount)
+            self.emitRate()
+            self.processGames(games)
         # Showing results
-        if current == correct:
+        correct = paginator.loaded
+        if paginator.failed == 0:
             self.setInfoRowColor.emit(6, None)
         else:
             self.setInfoRowColor.emit(6, "dark-red")
-        self.resultProgress.emit("Finished loading recent games", correct, Config.instance()["Settings"]["gameListCount"])
+        if paginator.finished:
+            self.resultProgress.emit("Finished loading recent games", correct, correct)
+        else:
+            self.resultProgress.emit("Finished loading recent games", correct, self.settings.gameListCount)
+    
+
+    def isLoadingFinished(self, games: list) -> bool:
+        """Checks if there are enough games to fill the table with recent games
+
+        Args:
+            games (list): Newly received games
+
+        Returns:
+            bool: True if no more games are needed
+        """
+        self.gamesLoaded += len(games)
+        return self.gamesLoaded >= self.settings.recentGamesCount
     
 
-    def processGames(self, data: dict):
+    def processGames(self, data: list):
         """Processes data about a certain game
 
         Args:
-            data (dict): Loaded game information
+            data (list): Loaded GameRecord objects
         """
         for game in data:
             # Showing game in a gameList table
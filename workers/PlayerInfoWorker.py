@@ -1,11 +1,13 @@
 from PyQt5 import QtCore
-import datetime, math
+import math
 
 from workers.Worker import *
 from misc.Config import *
 from tabs.Tab import *
 from misc.Functions import *
 from workers.TabInfoWorker import *
+from misc.Paginator import *
+from misc.XonStatClient import *
 
 
 class PlayerInfoWorker(TabInfoWorker):
@@ -14,9 +16,9 @@ class PlayerInfoWorker(TabInfoWorker):
 
 
     setInfoTextColor = QtCore.pyqtSignal(int, str)
-    showRecentGame = QtCore.pyqtSignal(dict)
+    showRecentGame = QtCore.pyqtSignal(object)
     updateHeatmap = QtCore.pyqtSignal(int, int)
-    showGameStats = QtCore.pyqtSignal(list, dict)
+    showGameStats = QtCore.pyqtSignal(object)
 
 
     def __init__(self, tab: Tab):
@@ -44,14 +46,12 @@ class PlayerInfoWorker(TabInfoWorker):
         self.thisWeek = 0
         # Checking if this player is being tracked
         self.checkConfigFile()
-        # Sleeping
-        self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
+        # Canceling
         if self.cancel:
             return
         # Loading player information
         games = self.loadPlayerInformation()
-        # Sleeping
-        self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
+        # Canceling
         if self.cancel:
             return
         # Loading recent games
@@ -64,18 +64,18 @@ class PlayerInfoWorker(TabInfoWorker):
         self.message.emit("Checking if player is tracked")
         for i in range(1, 2):
             self.setInfoRowColor.emit(i, "dark-yellow")
-        if not Config.instance().load("Players"):
+        if not PlayerRegistry.instance().refresh():
             # Creating new file for players
             Config.instance()["Players"] = []
             Config.instance().save("Players")
             # Checking if it was created
-            if not Config.instance().load("Players"):
+            if not PlayerRegistry.instance().refresh():
                 self.resultMessage.emit("Cannot access file with tracked players", False)
                 for i in range(1, 3):
                     self.setInfoRowColor.emit(i, "dark-red")
             else:
                 self.resultMessage.emit("Created a new config file for players", True)
-        if Config.instance().load("Players"):
+        if PlayerRegistry.instance().refresh():
             player = checkPlayerExistence(self.tab.id)
             if player is not None:
                 self.resultMessage.emit("This player is already being tracked", True)
@@ -96,31 +96,27 @@ class PlayerInfoWorker(TabInfoWorker):
         self.message.emit("Loading player information")
         for i in range(3, 7):
             self.setInfoRowColor.emit(i, "dark-yellow")
-        response = None
+        player = None
         try:
-            response = createRequest("https://stats.xonotic.org/player/" + str(self.tab.id))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            player = XonStatClient(self.tab).player(self.tab.id)
         except:
             pass
+        self.emitRate()
         # Checking response
-        if response is not None and response:
-            data = response.json()
+        if player is not None:
             # Showing player information
-            self.setInfoContent.emit(3, processNick( data["player"]["nick"] ))
-            since = data["player"]["joined_fuzzy"]
-            self.setInfoContent.emit(4, since)
-            self.setInfoTextColor.emit(4, getAgeColor(since))
-            active = data["overall_stats"]["overall"]["last_played_fuzzy"]
-            self.setInfoContent.emit(5, active)
-            self.setInfoTextColor.emit(5, getActiveColor(active))
-            self.setInfoContent.emit(6, str(round(data["overall_stats"]["overall"]["total_playing_time"] / 3600)) + " hours; " + str(data["games_played"]["overall"]["games"]) + " games")
+            self.setInfoContent.emit(3, processNick(player.nick))
+            self.setInfoContent.emit(4, player.joinedFuzzy)
+            self.setInfoTextColor.emit(4, getAgeColor(player.joinedFuzzy))
+            self.setInfoContent.emit(5, player.lastPlayedFuzzy)
+            self.setInfoTextColor.emit(5, getActiveColor(player.lastPlayedFuzzy))
+            self.setInfoContent.emit(6, str(round(player.playingTime / 3600)) + " hours; " + str(player.games) + " games")
             self.resultMessage.emit("Successfully loaded player information", True)
             for i in range(3, 7):
                 self.setInfoRowColor.emit(i, None)
             # Processing game stats information
-            dataList = sorted(data["games_played"].values(), key=lambda x: x["games"], reverse=True)
-            self.showGameStats.emit(dataList, data["overall_stats"])
-            return data["games_played"]["overall"]["games"]
+            self.showGameStats.emit(player.gameModes)
+            return player.games
         else:
             self.resultMessage.emit("Unable to load player information", False)
             for i in range(3, 7):
@@ -134,70 +130,75 @@ class PlayerInfoWorker(TabInfoWorker):
         Args:
             games (int, optional): Total game count. Defaults to None.
         """
-        gamesLoaded = 0
-        current = 0
-        correct = 0
+        self.gamesLoaded = 0
         self.message.emit("Loading recent games")
         self.setInfoContent.emit(7, "0")
         self.setInfoRowColor.emit(7, "dark-yellow")
         # Loading list of games
-        url = "https://stats.xonotic.org/games?player_id=" + str(self.tab.id)
-        for i in range( Config.instance()["Settings"]["gameListCount"] ):
-            # Sleeping
-            time.sleep( Config.instance()["Settings"]["singleRequestInterval"] )
+        client = XonStatClient(self.tab)
+        # Games older than the newest archived game are read from the archive
+        archive = "player/" + str(self.tab.id) if self.settings.gameArchive else None
+        paginator = Paginator(lambda startGameID: client.streamGames(playerID=self.tab.id, startGameID=startGameID), self.settings.gameListCount, lambda games: self.isLoadingFinished(games, totalGames), archive)
+        for games in paginator:
             # Canceling
             if self.cancel:
                 break
-            # Getting list of games
-            current += 1
-            self.progress.emit(current, Config.instance()["Settings"]["gameListCount"])
-            try:
-                response = createRequest(url)
-                self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
-                if response:
-                    correct += 1
-                    data = response.json()
-                    if data is not None and len(data) > 0:
-                        gamesLoaded += len(data)
-                        self.processGames(data)
-                        # Getting new URL
-                        url = "https://stats.xonotic.org/games?player_id=" + str(self.tab.id) + "&start_game_id=" + str(data[-1]["game_id"] -1)
-                    else:
-                        break
-            except:
-                pass
+            # Showing games while the page is being loaded
+            self.progress.emit(paginator.loaded + paginator.failed, self.settings.gameListCount)
+            self.emitRate()
+            self.processGames(games)
         # Showing results
-        if current == correct:
+        correct = paginator.loaded
+        if paginator.failed == 0:
             self.setInfoRowColor.emit(7, None)
         else:
             self.setInfoRowColor.emit(7, "dark-red")
-        if totalGames == gamesLoaded:
+        if paginator.finished:
             self.resultProgress.emit("Finished loading recent games", correct, correct)
         else:
-            self.resultProgress.emit("Finished loading recent games", correct, Config.instance()["Settings"]["gameListCount"])
+            self.resultProgress.emit("Finished loading recent games", correct, self.settings.gameListCount)
     
 
-    def processGames(self, data: dict):
+    def isLoadingFinished(self, games: list, totalGames: int = None) -> bool:
+        """Checks if there is no need to load more games. That happens when all player's games are loaded
+        or when games older than a week are reached after enough recent games were loaded.
+
+        Args:
+            games (list): Newly received games
+            totalGames (int, optional): Total game count. Defaults to None.
+
+        Returns:
+            bool: True if no more games are needed
+        """
+        self.gamesLoaded += len(games)
+        if totalGames is not None and self.gamesLoaded >= totalGames:
+            return True
+        if len(games) == 0 or self.gamesLoaded < self.settings.recentGamesCount:
+            return False
+        return int(time.time()) - games[-1].createDt.timestamp() > 60 * 60 * 24 * 7
+
+
+    def processGames(self, data: list):
         """Processes data about a certain game
 
         Args:
-            data (dict): Loaded game information
+            data (list): Loaded GameRecord objects
         """
         for game in data:
             # Checking if this game happened within the last 7 days
-            gameDatetime = datetime.datetime.strptime(game["create_dt"], "%Y-%m-%dT%H:%M:%SZ")
+            gameDatetime = game.createDt
             gameTime = gameDatetime.timestamp()
             currentTime = int(time.time())
             week = 60 * 60 * 24 * 7
             if (currentTime - gameTime) <= week:
                 # Getting information from datetime
                 row = gameDatetime.date().weekday()
-                column = gameDatetime.hour // Config.instance()["Settings"]["heatmapHourSpan"]
+                column = gameDatetime.hour // self.settings.heatmapHourSpan
                 # Updating heatmap
                 self.updateHeatmap.emit(row, column)
                 # Updating info label
                 self.thisWeek += 1
-                if self.thisWeek == Config.instance()["Settings"]["gameListCount"] * 20:
+                if self.thisWeek == self.settings.gameListCount * 20:
                     self.setInfoContent.emit(7, ">" + str(self.thisWeek) + " (>" + str(math.floor(self.thisWeek / 7)) + " games per day)")
                 else:
                     self.setInfoContent.emit(7, str(self.thisWeek) + " (~" + str(math.floor(self.thisWeek / 7)) + " games per day)")
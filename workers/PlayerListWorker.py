@@ -1,9 +1,12 @@
 from PyQt5 import QtCore
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 from workers.Worker import *
 from misc.Config import *
 from tabs.Tab import *
 from misc.Functions import *
+from misc.XonStatClient import *
+from misc.PlayerHistory import *
 
 
 class PlayerListWorker(Worker):
@@ -11,11 +14,13 @@ class PlayerListWorker(Worker):
     """
 
 
-    addPlayer = QtCore.pyqtSignal(dict)
-    insertPlayer = QtCore.pyqtSignal(dict, int)
+    addPlayer = QtCore.pyqtSignal(object)
+    insertPlayer = QtCore.pyqtSignal(object, int)
     removePlayer = QtCore.pyqtSignal(int)
     setRowColor = QtCore.pyqtSignal(int, str)
-    updatePlayer = QtCore.pyqtSignal(int, dict)
+    updatePlayer = QtCore.pyqtSignal(int, object)
+    updateRowColor = QtCore.pyqtSignal(int)
+    pageSize = 500 # Number of players loaded from the list of tracked players at once
 
 
     def __init__(self, tab: Tab):
@@ -25,6 +30,7 @@ class PlayerListWorker(Worker):
             tab (Tab): Tab object that this class was instantiated in
         """
         super().__init__(tab)
+        self.versions = {} # Versions of cached responses that are currently shown, by player ID
     
 
     def connectSlots(self):
@@ -33,8 +39,9 @@ class PlayerListWorker(Worker):
         self.addPlayer.connect(self.tab.addPlayer)
         self.insertPlayer.connect(self.tab.addPlayer)
         self.removePlayer.connect(self.tab.removePlayer)
-        self.setRowColor.connect(self.tab.table.setRowColor)
+        self.setRowColor.connect(self.tab.setRowColor)
         self.updatePlayer.connect(self.tab.updatePlayer)
+        self.updateRowColor.connect(self.tab.updateRowColor)
     
 
     def run(self):
@@ -44,7 +51,6 @@ class PlayerListWorker(Worker):
         new = self.loadPlayers()
         if new is not None:
             # Cancelling
-            self.sleep( Config.instance()["Settings"]["groupRequestInterval"] )
             if self.cancel:
                 return
             # Loading player information
@@ -58,27 +64,29 @@ class PlayerListWorker(Worker):
             list: New list of players
         """
         # Checking config file existence
-        if not Config.instance().load("Players"):
+        if not PlayerRegistry.instance().refresh():
             # Creating new file for players
             Config.instance()["Players"] = []
             Config.instance().save("Players")
             # Checking if it was created
-            if not Config.instance().load("Players"):
+            if not PlayerRegistry.instance().refresh():
                 self.resultMessage.emit("Cannot find a config file with players", False)
                 return
             else:
                 self.resultMessage.emit("Created a new config file for players", True)
         # Checking player count
-        if len(Config.instance()["Players"]) == 0:
+        if PlayerRegistry.instance().count() == 0:
             self.resultMessage.emit("No players were found", True)
             return
         # Loading differences from player lists
         self.message.emit("Loading differences from player lists")
         # Getting list of player ID's
-        old = [int(self.tab.table.cellWidget(i, 0).text()) for i in range(self.tab.table.rowCount())]
-        new = [Config.instance()["Players"][i]["id"] for i in range(len(Config.instance()["Players"]))]
-        add = [item for item in new if item not in old]
-        remove = [item for item in old if item not in new]
+        old = self.tab.model.getIDs()
+        new = PlayerRegistry.instance().getIDs()
+        oldIDs = set(old)
+        newIDs = set(new)
+        add = [item for item in new if item not in oldIDs]
+        remove = [item for item in old if item not in newIDs]
         # Loading player differences
         self.loadDifferences(old, new, add, remove)
         return new
@@ -95,25 +103,38 @@ class PlayerListWorker(Worker):
         """
         i = 0
         # Removing unused rows
+        oldIndexes = {playerID: index for index, playerID in enumerate(old)}
         remove.reverse()
         for playerID in remove:
             if self.cancel:
                 break
             i += 1
-            self.removePlayer.emit(old.index(playerID))
+            self.versions.pop(playerID, None)
+            self.removePlayer.emit(oldIndexes[playerID])
             self.progress.emit(i, len(add) + len(remove))
-        # Adding new rows
-        for playerID in add:
+        # Adding new rows, players are loaded by pages
+        addIDs = set(add)
+        page = []
+        pageOffset = None
+        for index in [index for index, playerID in enumerate(new) if playerID in addIDs]:
             if self.cancel:
                 break
+            offset = index - index % PlayerListWorker.pageSize
+            if offset != pageOffset:
+                page = PlayerRegistry.instance().getPage(offset, PlayerListWorker.pageSize)
+                pageOffset = offset
+            # The list could have been changed in the meantime
+            if index - offset >= len(page) or page[index - offset]["id"] != new[index]:
+                break
             i += 1
-            self.insertPlayer.emit(Config.instance()["Players"][new.index(playerID)], new.index(playerID))
+            self.versions.pop(new[index], None)
+            self.insertPlayer.emit(page[index - offset], index)
             self.progress.emit(i, len(add) + len(remove))
         self.resultProgress.emit("Finished loading differences from player lists", i, len(add) + len(remove))
     
 
     def loadInformation(self, new: list):
-        """Loads information about players from XonStat
+        """Loads information about players from XonStat, using multiple threads at once
 
         Args:
             new (list): New player index list
@@ -121,23 +142,60 @@ class PlayerListWorker(Worker):
         self.message.emit("Loading player information")
         i = 0
         correct = 0
+        executor = ThreadPoolExecutor(max_workers=max(1, self.settings.playerListConcurrency))
+        futures = {}
+        loaded = []
+        canceled = self.canceled # Event of this run, requests that are still waiting stop when it is set
         for index in range(len(new)):
-            if self.cancel:
-                break
-            playerID = new[index]
-            self.setRowColor.emit(index, "dark-yellow")
-            self.sleep( Config.instance()["Settings"]["singleRequestInterval"] )
-            response = None
-            try:
-                response = createRequest("https://stats.xonotic.org/player/" + str(playerID))
-                self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
-            except:
-                pass
-            if response is not None and response:
-                correct += 1
-                self.updatePlayer.emit(index, response.json())
-            else:
-                self.setRowColor.emit(index, "dark-red")
-            i += 1
-            self.progress.emit(i, len(new))
-        self.resultProgress.emit("Finished loading player information", correct, len(new))
\ No newline at end of file
+            futures[executor.submit(self.loadPlayer, index, new[index], canceled)] = index
+        # Showing results as soon as they are loaded
+        pending = set(futures)
+        while len(pending) > 0 and not self.cancel:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                index = futures[future]
+                player = future.result()
+                if player is not None:
+                    correct += 1
+                    loaded.append(player)
+                    # Redrawing the row only if the player information changed
+                    if player.version is not None and self.versions.get(new[index]) == player.version:
+                        self.updateRowColor.emit(index)
+                    else:
+                        self.versions[new[index]] = player.version
+                        self.updatePlayer.emit(index, player)
+                else:
+                    self.setRowColor.emit(index, "dark-red")
+                i += 1
+                self.progress.emit(i, len(new))
+        # Waiting for requests that were already sent, so that they do not change rows after this run ends
+        executor.shutdown(wait=True, cancel_futures=True)
+        # Storing statistics of loaded players for later comparison
+        try:
+            PlayerHistory.instance().record(loaded)
+        except sqlite3.Error as e:
+            print("Unable to store player history: " + str(e))
+        self.resultProgress.emit("Finished loading player information", correct, len(new))
+
+
+    def loadPlayer(self, index: int, playerID: int, canceled: threading.Event):
+        """Loads information about a single player. This method is run in a thread pool.
+
+        Args:
+            index (int): Row index
+            playerID (int): Player ID
+            canceled (threading.Event): Event that is set when the run is canceled
+
+        Returns:
+            PlayerRecord: Player information, None if the request failed or was canceled
+        """
+        if canceled.is_set():
+            return None
+        self.setRowColor.emit(index, "dark-yellow")
+        player = None
+        try:
+            player = XonStatClient(self.tab, canceled).player(playerID)
+        except:
+            pass
+        self.emitRate()
+        return player
\ No newline at end of file
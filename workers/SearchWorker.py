@@ -1,8 +1,8 @@
 from PyQt5 import QtCore
-import datetime
 
 from workers.Worker import *
 from misc.Functions import *
+from misc.XonStatClient import *
 
 
 class SearchWorker(Worker):
@@ -37,16 +37,16 @@ class SearchWorker(Worker):
         # Getting search phrase
         phrase = self.tab.searchBar.text()
         # Loading list of players
+        players = None
         try:
-            response = createRequest("https://stats.xonotic.org/players?nick=" + phrase)
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            players = XonStatClient(self.tab).search(phrase)
         except:
             pass
+        self.emitRate()
         # Checking response
-        if response is not None and response:
-            data = response.json()
-            for player in data["players"]:
-                self.showPlayer.emit(player["player_id"], processNick(player["nick"]))
+        if players is not None:
+            for player in players:
+                self.showPlayer.emit(player.id, processNick(player.nick))
             self.resultMessage.emit("Successfully loaded list of players", True)
         else:
             self.resultMessage.emit("Failed to load list of players", False)
\ No newline at end of file
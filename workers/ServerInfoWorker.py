@@ -1,9 +1,10 @@
 from PyQt5 import QtCore
-import datetime
 
 from misc.Config import *
 from misc.Functions import *
 from workers.TabInfoWorker import *
+from misc.Paginator import *
+from misc.XonStatClient import *
 
 
 class ServerInfoWorker(TabInfoWorker):
@@ -12,7 +13,7 @@ class ServerInfoWorker(TabInfoWorker):
 
 
     showPlayer = QtCore.pyqtSignal(int, str, int, str)
-    showRecentGame = QtCore.pyqtSignal(dict)
+    showRecentGame = QtCore.pyqtSignal(object)
 
 
     def __init__(self, tab: Tab):
@@ -37,14 +38,12 @@ class ServerInfoWorker(TabInfoWorker):
         """
         # Loading player information
         self.loadServerInformation()
-        # Sleeping
-        self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
+        # Canceling
         if self.cancel:
             return
         # Loading players
         self.loadPlayers()
-        # Sleeping
-        self.sleep(Config.instance()["Settings"]["groupRequestInterval"])
+        # Canceling
         if self.cancel:
             return
         # Loading recent games
@@ -57,20 +56,19 @@ class ServerInfoWorker(TabInfoWorker):
         self.message.emit("Loading server information")
         for i in range(1, 5):
             self.setInfoRowColor.emit(i, "dark-yellow")
-        response = None
+        server = None
         try:
-            response = createRequest("https://stats.xonotic.org/server/" + str(self.tab.id))
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
+            server = XonStatClient(self.tab).server(self.tab.id)
         except:
             pass
+        self.emitRate()
         # Checking response
-        if response is not None and response:
-            data = response.json()
+        if server is not None:
             # Showing player information
-            self.setInfoContent.emit(1, data["name"])
-            self.setInfoContent.emit(2, data["ip_addr"])
-            self.setInfoContent.emit(3, str(data["port"]))
-            self.setInfoContent.emit(4, data["create_dt"])
+            self.setInfoContent.emit(1, server.name)
+            self.setInfoContent.emit(2, server.ipAddress)
+            self.setInfoContent.emit(3, str(server.port))
+            self.setInfoContent.emit(4, server.createDt)
             self.resultMessage.emit("Successfully loaded server information", True)
             for i in range(1, 5):
                 self.setInfoRowColor.emit(i, None)
@@ -84,70 +82,72 @@ class ServerInfoWorker(TabInfoWorker):
         """Loading top scoring players
         """
         self.message.emit("Loading top scoring players")
-        response = None
+        successful = True
         try:
-            response = createRequest("https://stats.xonotic.org/server/" + str(self.tab.id) + "/topscorers")
-            self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
-        except:
-            pass
-        # Checking response
-        if response is not None and response:
-            data = response.json()
-            # Adding players to table
-            for player in data["top_scorers"]:
-                if checkPlayerExistence(player["player_id"]):
+            # Adding players to table while the response is being received
+            for player in XonStatClient(self.tab).streamTopScorers(self.tab.id):
+                if checkPlayerExistence(player.id):
                     color = "dark-blue"
                 else:
                     color = None
-                self.showPlayer.emit(player["player_id"], processNick(player["nick"]), player["score"], color)
+                self.showPlayer.emit(player.id, processNick(player.nick), player.score, color)
+        except:
+            successful = False
+        self.emitRate()
+        # Checking response
+        if successful:
             self.resultMessage.emit("Successfully loaded top scoring players", True)
         else:
             self.resultMessage.emit("Failed to load top scoring players", False)
     
 
     def loadGames(self):
-        current = 0
-        correct = 0
         self.message.emit("Loading recent games")
         self.setInfoRowColor.emit(6, "dark-yellow")
-        # Loading list of games
-        url = "https://stats.xonotic.org/games?server_id=" + str(self.tab.id)
-        for i in range( Config.instance()["Settings"]["gameListCount"] ):
-            # Sleeping
-            time.sleep( Config.instance()["Settings"]["singleRequestInterval"] )
+        # Loading list of games until there are enough of them to fill the table
+        self.gamesLoaded = 0
+        client = XonStatClient(self.tab)
+        # Games older than the newest archived game are read from the archive
+        archive = "server/" + str(self.tab.id) if self.settings.gameArchive else None
+        paginator = Paginator(lambda startGameID: client.streamGames(serverID=self.tab.id, startGameID=startGameID), self.settings.gameListCount, self.isLoadingFinished, archive)
+        for games in paginator:
             # Canceling
             if self.cancel:
                 break
-            # Getting list of games
-            current += 1
-            self.progress.emit(current, Config.instance()["Settings"]["gameListCount"])
-            try:
-                response = createRequest(url)
-                self.showRate.emit(response.headers["X-Ratelimit-Remaining"], response.headers["X-Ratelimit-Limit"])
-                if response:
-                    correct += 1
-                    data = response.json()
-                    if data is not None and len(data) > 0:
-                        self.processGames(data)
-                        # Getting new URL
-                        url = "https://stats.xonotic.org/games?server_id=" + str(self.tab.id) + "&start_game_id=" + str(data[-1]["game_id"] -1)
-                    else:
-                        break
-            except:
-                pass
+            # Showing games while the page is being loaded
+            self.progress.emit(paginator.loaded + paginator.failed, self.settings.gameListCount)
+            self.emitRate()
+            self.processGames(games)
         # Showing results
-        if current == correct:
+        correct = paginator.loaded
+        if paginator.failed == 0:
             self.setInfoRowColor.emit(6, None)
         else:
             self.setInfoRowColor.emit(6, "dark-red")
-        self.resultProgress.emit("Finished loading recent games", correct, Config.instance()["Settings"]["gameListCount"])
+        if paginator.finished:
+            self.resultProgress.emit("Finished loading recent games", correct, correct)
+        else:
+            self.resultProgress.emit("Finished loading recent games", correct, self.settings.gameListCount)
+    
+
+    def isLoadingFinished(self, games: list) -> bool:
+        """Checks if there are enough games to fill the table with recent games
+
+        Args:
+            games (list): Newly received games
+
+        Returns:
+            bool: True if no more games are needed
+        """
+        self.gamesLoaded += len(games)
+        return self.gamesLoaded >= self.settings.recentGamesCount
     
 
-    def processGames(self, data: dict):
+    def processGames(self, data: list):
         """Processes data about a certain game
 
         Args:
-            data (dict): Loaded game information
+            data (list): Loaded GameRecord objects
         """
         for game in data:
             # Showing game in a gameList table
@@ -52,7 +52,8 @@ class SettingsWorker(Worker):
         """
         # Showing message
         self.message.emit("Loading settings into table")
-        success = Config.instance().load("Settings")
+        # Settings are loaded again by Config when Settings.json changes
+        success = "Settings" in Config.instance()
         # Loading settings
         for name, value in Config.instance()["Settings"].items():
             name = self.processSettingName(name)
@@ -1,7 +1,10 @@
 from PyQt5 import QtCore
-import time
+import time, threading
 
 from tabs.Tab import *
+from misc.RateLimiter import *
+from misc.Client import *
+from misc.Config import *
 
 
 class Worker(QtCore.QThread):
@@ -14,6 +17,7 @@ class Worker(QtCore.QThread):
     resultMessage = QtCore.pyqtSignal(str, bool)
     resultProgress = QtCore.pyqtSignal(str, int, int)
     showRate = QtCore.pyqtSignal(str, str)
+    showPoolStats = QtCore.pyqtSignal(int, int)
     updateRefreshButtons = QtCore.pyqtSignal()
     clearOldInformation = QtCore.pyqtSignal()
 
@@ -26,7 +30,9 @@ class Worker(QtCore.QThread):
         """
         super().__init__()
         self.tab = tab
+        self.canceled = threading.Event() # Set when the current run is canceled, each run gets a new event
         self.cancel = False
+        self.settings = Config.instance().settings # Settings used during the current run
         # Connecting slots and signals
         self.started.connect(self.before)
         self.finished.connect(self.after)
@@ -35,17 +41,50 @@ class Worker(QtCore.QThread):
         self.resultMessage.connect(self.tab.status.resultMessage)
         self.resultProgress.connect(self.tab.status.resultProgress)
         self.showRate.connect(self.tab.status.showRate)
+        self.showPoolStats.connect(self.tab.status.showPoolStats)
         self.updateRefreshButtons.connect(self.tab.parent.updateRefreshButtons)
         self.clearOldInformation.connect(self.tab.clearOldInformation)
         self.connectSlots()
     
 
+    @property
+    def cancel(self) -> bool:
+        """Checks if canceling of the current run is requested
+
+        Returns:
+            bool: True if this worker should stop
+        """
+        return self.canceled.is_set()
+
+
+    @cancel.setter
+    def cancel(self, value: bool):
+        """Requests canceling of the current run. Resetting it does not affect requests of the canceled run.
+
+        Args:
+            value (bool): Should this worker stop?
+        """
+        if value:
+            self.canceled.set()
+        elif self.canceled.is_set():
+            self.canceled = threading.Event()
+
+
     def connectSlots(self):
         """Connecting signals to slots. This method is called in init.
         """
         pass
     
 
+    def start(self, *args):
+        """Starts this worker with the current settings, which stay the same until it finishes
+        """
+        self.settings = Config.instance().settings
+        if self.canceled.is_set():
+            self.canceled = threading.Event()
+        super().start(*args)
+    
+
     def before(self):
         """This method is called before this worker is run
         """
@@ -70,4 +109,14 @@ class Worker(QtCore.QThread):
                 if self.cancel:
                     return
         else:
-            time.sleep(amount)
\ No newline at end of file
+            time.sleep(amount)
+    
+
+    def emitRate(self):
+        """Shows rate limit reported by the server in the last response and connection pool usage
+        """
+        limiter = RateLimiter.instance()
+        if limiter.limit is not None:
+            self.showRate.emit(str(limiter.remaining), str(limiter.limit))
+        stats = Client.instance().stats()
+        self.showPoolStats.emit(stats["hits"], stats["misses"])
\ No newline at end of file